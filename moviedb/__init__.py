@@ -7,4 +7,4 @@ __red_end_user_data_statement__ = "This cog does not persistently store data abo
 
 
 async def setup(bot: Red):
-    await maybe_coroutine(bot.add_cog, MovieDB())
+    await maybe_coroutine(bot.add_cog, MovieDB(bot))
@@ -1,16 +1,62 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal, Optional, Sequence
+from typing import Any, Dict, FrozenSet, List, Literal, Mapping, Optional, Sequence, Type, TypeVar
 
 import aiohttp
 
+from .cache import TTLCache
+from .client import Priority, RateLimited, single_flight, tmdb_get
 
 API_BASE = "https://api.themoviedb.org/3"
-CDN_BASE = "https://image.tmdb.org/t/p/original"
 
+# Raw `/search/multi` results, shared by movie, TV show and person searches.
+# Size is counted in number of results so that a few broad queries can't hog it.
+SEARCH_CACHE: TTLCache[List[Dict[str, Any]]] = TTLCache(maxsize=20_000, ttl=1800, sizeof=len)
 
+T = TypeVar("T")
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """Rebuild a dataclass with ``__slots__``, since ``dataclass(slots=True)`` needs 3.10+.
+
+    Models are kept around in caches, and dropping the per instance ``__dict__``
+    roughly halves their footprint. Apply it above ``@dataclass``.
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = tuple(
+        f.name for f in dataclasses.fields(cls) if f.name not in inherited
+    )
+    for name in namespace["__slots__"]:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+_FIELD_NAMES: Dict[type, FrozenSet[str]] = {}
+
+
+def decode(cls: Type[T], data: Mapping[str, Any], **overrides: Any) -> T:
+    """Build a model from an API payload, ignoring any keys the model doesn't know about.
+
+    TMDB adds new fields every now and then, which used to make ``cls(**data)``
+    blow up with a TypeError. ``data`` is never mutated.
+    """
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = frozenset(f.name for f in dataclasses.fields(cls))
+    if overrides or not names.issuperset(data):
+        kwargs = {key: data[key] for key in names.intersection(data)}
+        kwargs.update(overrides)
+        return cls(**kwargs)
+    return cls(**data)
+
+
+@slotted
 @dataclass
 class BaseSearch:
     id: int
@@ -24,6 +70,7 @@ class BaseSearch:
     genre_ids: Sequence[int] = field(default_factory=list)
 
 
+@slotted
 @dataclass
 class MediaNotFound:
     status_message: str
@@ -38,6 +85,7 @@ class MediaNotFound:
         return self.status_message or f'https://http.cat/{self.http_code}.jpg'
 
 
+@slotted
 @dataclass
 class CelebrityCast:
     id: int
@@ -54,12 +102,14 @@ class CelebrityCast:
     profile_path: str = ""
 
 
+@slotted
 @dataclass
 class Genre:
     id: int
     name: str
 
 
+@slotted
 @dataclass
 class ProductionCompany:
     id: int
@@ -68,12 +118,14 @@ class ProductionCompany:
     origin_country: str = ""
 
 
+@slotted
 @dataclass
 class ProductionCountry:
     iso_3166_1: str
     name: str
 
 
+@slotted
 @dataclass
 class SpokenLanguage:
     name: str
@@ -86,21 +138,46 @@ async def multi_search(
     api_key: str,
     query: str,
     include_adult: Literal["true", "false"] = "false",
+    *,
+    priority: Priority = Priority.INTERACTIVE,
+) -> List[Dict[str, Any]] | MediaNotFound:
+    # normalised before the single-flight key too, so "Dune" and "dune " share a request
+    query = " ".join(query.lower().split())
+    return await _multi_search(session, api_key, query, include_adult, priority=priority)
+
+
+@single_flight
+async def _multi_search(
+    session: aiohttp.ClientSession,
+    api_key: str,
+    query: str,
+    include_adult: Literal["true", "false"],
+    *,
+    priority: Priority = Priority.INTERACTIVE,
 ) -> List[Dict[str, Any]] | MediaNotFound:
+    cache_key = (query, include_adult)
+    if (cached := SEARCH_CACHE.get(cache_key)) is not None:
+        return cached
+
     try:
-        async with session.get(
+        async with tmdb_get(
+            session,
             f"{API_BASE}/search/multi",
-            params={"api_key": api_key, "query": query, "include_adult": include_adult}
+            params={"api_key": api_key, "query": query, "include_adult": include_adult},
+            priority=priority,
         ) as resp:
             if resp.status in [401, 404]:
                 data = await resp.json()
-                return MediaNotFound(**data)
+                return decode(MediaNotFound, data, http_code=resp.status)
             if resp.status != 200:
                 return MediaNotFound("No results found.", resp.status)
             all_data: dict = await resp.json()
+    except RateLimited:
+        return MediaNotFound("⚠️ Too many requests to TMDB right now, try again in a moment.", 429)
     except (asyncio.TimeoutError, aiohttp.ClientError):
         return MediaNotFound("Operation timed out!", 408)
 
     if not all_data.get("results"):
         return MediaNotFound("No results found.", resp.status)
+    SEARCH_CACHE.set(cache_key, all_data["results"])
     return all_data["results"]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Size bounded LRU cache whose entries also expire after ``ttl`` seconds.
+
+    ``maxsize`` is measured in whatever unit ``sizeof`` returns for a value,
+    which by default is simply one per entry.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        sizeof: Callable[[V], int] = lambda _: 1,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.currsize = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Tuple[float, int, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, _, value = entry
+        if expires_at < time.monotonic():
+            self.pop(key)
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        size = self.sizeof(value)
+        if size > self.maxsize:
+            return
+        self.pop(key)
+        self._data[key] = (time.monotonic() + self.ttl, size, value)
+        self.currsize += size
+        while self.currsize > self.maxsize:
+            _, (_, old_size, _) = self._data.popitem(last=False)
+            self.currsize -= old_size
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return None
+        self.currsize -= entry[1]
+        return entry[2]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.currsize = 0
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "size": self.currsize,
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
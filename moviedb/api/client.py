@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import enum
+import functools
+import heapq
+import itertools
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import aiohttp
+
+T = TypeVar("T")
+
+
+def _flight_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    # session is deliberately left out, and IDs may arrive as either str or int.
+    # priority stays in the key: a request inherits its starter's place in the rate
+    # limiter queue and, for autocomplete, its shedding, which other callers must not.
+    positional = tuple(
+        arg if isinstance(arg, type) else str(arg)
+        for arg in args
+        if not isinstance(arg, aiohttp.ClientSession)
+    )
+    options = {**kwargs, "priority": int(kwargs.get("priority", Priority.INTERACTIVE))}
+    return positional + tuple(sorted(options.items()))
+
+
+class Flight:
+    """A request started by :func:`single_flight`, as far as the rate limiter is concerned."""
+
+    __slots__ = ("priority", "limiter", "waiter")
+
+    def __init__(self, priority: int) -> None:
+        self.priority = priority
+        self.limiter: Optional[RateLimiter] = None
+        # the limiter queue entry this request is waiting on, if it hasn't been sent yet
+        self.waiter: Optional[asyncio.Future] = None
+
+    def promote(self, priority: int) -> None:
+        if priority >= self.priority:
+            return
+        self.priority = priority
+        if self.limiter is not None and self.waiter is not None and not self.waiter.done():
+            self.limiter.reprioritise(self.waiter, priority)
+
+
+# the flight the current task is running, read by RateLimiter.acquire
+_FLIGHT: contextvars.ContextVar[Optional[Flight]] = contextvars.ContextVar("flight", default=None)
+
+
+def single_flight(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Coalesce concurrent calls made with the same arguments into one upstream request.
+
+    Every caller awaits the same shared task, so the returned object must be
+    treated as read-only. A caller being cancelled (e.g. an autocomplete that
+    got superseded) does not cancel the request for everyone else.
+    An interactive call also takes over a background request for the same
+    arguments, moving it up the rate limiter queue if it hasn't been sent yet.
+    """
+    inflight: Dict[Hashable, Tuple[asyncio.Future, Flight]] = {}
+
+    async def run(flight: Flight, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> T:
+        _FLIGHT.set(flight)
+        return await func(*args, **kwargs)
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = _flight_key(args, kwargs)
+        entry = inflight.get(key)
+        priority = int(kwargs.get("priority", Priority.INTERACTIVE))
+        if entry is None and priority == Priority.INTERACTIVE:
+            # background requests are never shed, so joining one can't fail where
+            # a request of our own would have gone through
+            entry = inflight.get(_flight_key(args, {**kwargs, "priority": Priority.BACKGROUND}))
+            if entry is not None:
+                entry[1].promote(priority)
+                inflight[key] = entry
+                entry[0].add_done_callback(lambda _: inflight.pop(key, None))
+        if entry is None:
+            flight = Flight(priority)
+            entry = (asyncio.ensure_future(run(flight, args, kwargs)), flight)
+            inflight[key] = entry
+            entry[0].add_done_callback(lambda _: inflight.pop(key, None))
+        return await asyncio.shield(entry[0])
+
+    return wrapper
+
+
+class Priority(enum.IntEnum):
+    INTERACTIVE = 0
+    AUTOCOMPLETE = 1
+    BACKGROUND = 2
+
+
+class RateLimited(Exception):
+    """Raised when a low priority request is shed instead of being queued."""
+
+
+class RateLimiter:
+    """Token bucket shared by every TMDB request, which hands out tokens by priority.
+
+    Interactive lookups always queue. Autocomplete requests are shed straight away
+    when the queue is saturated, or once they have waited longer than ``shed_after``,
+    because Discord discards autocomplete responses after 3 seconds anyway.
+    Background work (cache pre-warming) only gets tokens nobody else is waiting for.
+    """
+
+    def __init__(
+        self,
+        rate: int = 40,
+        per: float = 10.0,
+        *,
+        max_queue: int = 20,
+        shed_after: float = 1.5,
+    ) -> None:
+        self.capacity = rate
+        self.fill_rate = rate / per
+        self.tokens = float(rate)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.max_queue = max_queue
+        self.shed_after = shed_after
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.acquired = 0
+        self.shed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for *_, fut in self._waiters if not fut.done())
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "tokens": round(self.tokens, 2),
+            "acquired": self.acquired,
+            "shed": self.shed,
+            "avg_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait,
+            "blocked_for": max(0.0, self.blocked_until - time.monotonic()),
+        }
+
+    def _take(self) -> bool:
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return False
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def _delay(self) -> float:
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        return max(0.0, (1 - self.tokens) / self.fill_rate)
+
+    def _record(self, started: float) -> None:
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            fut = self._waiters[0][2]
+            if fut.done():
+                heapq.heappop(self._waiters)
+            elif self._take():
+                heapq.heappop(self._waiters)
+                fut.set_result(None)
+            else:
+                await asyncio.sleep(self._delay())
+
+    def reprioritise(self, fut: asyncio.Future, priority: int) -> None:
+        for i, (_, count, waiter) in enumerate(self._waiters):
+            if waiter is fut:
+                self._waiters[i] = (priority, count, fut)
+                heapq.heapify(self._waiters)
+                return
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        started = time.monotonic()
+        flight = _FLIGHT.get()
+        if flight is not None:
+            # the flight may have been promoted since its request was built
+            priority = Priority(min(priority, flight.priority))
+        if not self.queue_depth and self._take():
+            self._record(started)
+            return
+
+        low_priority = priority == Priority.AUTOCOMPLETE
+        if low_priority:
+            ahead = sum(1 for prio, _, fut in self._waiters if prio <= priority and not fut.done())
+            if ahead >= self.max_queue or self._delay() > self.shed_after:
+                self.shed += 1
+                raise RateLimited()
+
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), fut))
+        if flight is not None:
+            flight.limiter, flight.waiter = self, fut
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            await asyncio.wait_for(fut, self.shed_after if low_priority else None)
+        except asyncio.TimeoutError:
+            self.shed += 1
+            raise RateLimited() from None
+        self._record(started)
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        """Sync the bucket with what TMDB told us in the response headers."""
+        now = time.monotonic()
+        if status == 429:
+            with contextlib.suppress(ValueError):
+                retry_after = float(headers.get("Retry-After", 1))
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+            self.tokens = 0.0
+        with contextlib.suppress(KeyError, ValueError):
+            remaining = int(headers["X-RateLimit-Remaining"])
+            self.tokens = min(self.tokens, float(remaining))
+            if remaining <= 0:
+                reset_in = float(headers["X-RateLimit-Reset"]) - time.time()
+                self.blocked_until = max(self.blocked_until, now + max(reset_in, 0.0))
+
+
+LIMITER = RateLimiter()
+
+
+@contextlib.asynccontextmanager
+async def tmdb_get(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    params: Dict[str, Any],
+    priority: Priority = Priority.INTERACTIVE,
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """Paced drop-in for ``session.get`` which all TMDB requests should go through."""
+    await LIMITER.acquire(priority)
+    async with session.get(url, params=params) as resp:
+        LIMITER.update(resp.status, resp.headers)
+        yield resp
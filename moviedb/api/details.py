@@ -2,15 +2,39 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
 import aiohttp
 from redbot.core.utils.chat_formatting import humanize_number
 
-from .base import API_BASE, CelebrityCast, Genre, MediaNotFound, ProductionCompany, ProductionCountry, SpokenLanguage
+from .base import (
+    API_BASE,
+    CelebrityCast,
+    Genre,
+    MediaNotFound,
+    ProductionCompany,
+    ProductionCountry,
+    SpokenLanguage,
+    decode,
+    slotted,
+)
+from .cache import TTLCache
+from .client import Priority, RateLimited, single_flight, tmdb_get
+from .suggestions import MovieSuggestions, TVShowSuggestions
 from ..utils import format_date
 
+# Everything TMDB knows about a title is fetched in one call (see APPEND_TO_RESPONSE),
+# so `[p]movie` followed by `[p]suggestmovies` (or vice versa) only costs one round trip.
+DETAILS_CACHE: TTLCache[Any] = TTLCache(maxsize=512, ttl=6 * 3600)
+APPEND_TO_RESPONSE = 'credits,recommendations,similar,external_ids'
+# show ID -> {season number: SeasonDetails}, filled in as seasons get browsed
+SEASONS_CACHE: TTLCache[Dict[int, 'SeasonDetails']] = TTLCache(maxsize=64, ttl=6 * 3600)
+# TMDB caps append_to_response at 20 sub-requests per call
+SEASONS_PER_CALL = 20
+SEASON_CALLS_IN_FLIGHT = 3
 
+
+@slotted
 @dataclass
 class MovieDetails:
     id: int
@@ -39,6 +63,9 @@ class MovieDetails:
     spoken_languages: Sequence[SpokenLanguage] = field(default_factory=list)
     production_companies: Sequence[ProductionCompany] = field(default_factory=list)
     production_countries: Sequence[ProductionCountry] = field(default_factory=list)
+    recommendations: Sequence[MovieSuggestions] = field(default_factory=list)
+    similar: Sequence[MovieSuggestions] = field(default_factory=list)
+    external_ids: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def all_genres(self) -> str:
@@ -56,6 +83,10 @@ class MovieDetails:
     def all_spoken_languages(self) -> str:
         return ', '.join([g.name for g in self.spoken_languages])
 
+    @property
+    def suggestions(self) -> Sequence[MovieSuggestions]:
+        return self.recommendations or self.similar
+
     @property
     def humanize_runtime(self) -> str:
         if not self.runtime:
@@ -70,48 +101,70 @@ class MovieDetails:
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> MovieDetails:
-        btc = data.pop('belongs_to_collection', None)
-        genres = [Genre(**g) for g in data.pop('genres', [])]
-        credits = [CelebrityCast(**c) for c in data.pop('credits', {}).get('cast', [])]
+        btc = data.get('belongs_to_collection', None)
+        genres = [decode(Genre, g) for g in data.get('genres', [])]
+        credits = [decode(CelebrityCast, c) for c in data.get('credits', {}).get('cast', [])]
         spoken_languages = [
-            SpokenLanguage(**l) for l in data.pop('spoken_languages', [])
+            decode(SpokenLanguage, l) for l in data.get('spoken_languages', [])
         ]
         production_companies = [
-            ProductionCompany(**p) for p in data.pop('production_companies', [])
+            decode(ProductionCompany, p) for p in data.get('production_companies', [])
         ]
         production_countries = [
-            ProductionCountry(**pc) for pc in data.pop('production_countries', [])
+            decode(ProductionCountry, pc) for pc in data.get('production_countries', [])
         ]
-        return cls(
+        recommendations = MovieSuggestions.from_results(data.get('recommendations'))
+        similar = MovieSuggestions.from_results(data.get('similar'))
+        return decode(
+            cls,
+            data,
             belongs_to_collection=btc,
             genres=genres,
             credits=credits,
             spoken_languages=spoken_languages,
             production_companies=production_companies,
             production_countries=production_countries,
-            **data
+            recommendations=recommendations,
+            similar=similar,
+            external_ids=data.get('external_ids', {}),
         )
 
     @classmethod
+    @single_flight
     async def request(
-        cls, session: aiohttp.ClientSession, api_key: str, movie_id: Any
+        cls,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        movie_id: Any,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> MediaNotFound | MovieDetails:
+        if cached := DETAILS_CACHE.get(('movie', str(movie_id))):
+            return cached
+
         movie_data = {}
-        params = {'api_key': api_key, 'append_to_response': 'credits'}
+        params = {'api_key': api_key, 'append_to_response': APPEND_TO_RESPONSE}
         try:
-            async with session.get(f'{API_BASE}/movie/{movie_id}', params=params) as resp:
+            async with tmdb_get(
+                session, f'{API_BASE}/movie/{movie_id}', params=params, priority=priority
+            ) as resp:
                 if resp.status in [401, 404]:
                     err_data = await resp.json()
                     return MediaNotFound(err_data['status_message'], resp.status)
                 if resp.status != 200:
                     return MediaNotFound('', resp.status)
                 movie_data = await resp.json()
+        except RateLimited:
+            return MediaNotFound('⚠️ Too many requests to TMDB right now, try again in a moment.', 429)
         except (asyncio.TimeoutError, aiohttp.ClientError):
             return MediaNotFound('⚠️ Operation timed out.', 408)
 
-        return cls.from_json(movie_data)
+        movie = cls.from_json(movie_data)
+        DETAILS_CACHE.set(('movie', str(movie_id)), movie)
+        return movie
 
 
+@slotted
 @dataclass
 class Creator:
     id: int
@@ -121,16 +174,18 @@ class Creator:
     profile_path: str = ''
 
 
+@slotted
 @dataclass
 class EpisodeInfo:
     id: int
-    name: str
-    overview: str
-    air_date: str
-    episode_number: int
-    season_number: int
-    production_code: str
-    runtime: None
+    # TMDB leaves most of these out for episodes that haven't aired yet
+    name: str = ''
+    overview: str = ''
+    air_date: Optional[str] = None
+    episode_number: int = 0
+    season_number: int = 0
+    production_code: str = ''
+    runtime: Optional[int] = None
     show_id: int = 0
     vote_average: float = 0.0
     vote_count: int = 0
@@ -138,6 +193,7 @@ class EpisodeInfo:
 
 
 
+@slotted
 @dataclass
 class Network:
     id: int
@@ -146,17 +202,99 @@ class Network:
     origin_country: str = ''
 
 
+@slotted
 @dataclass
 class Season:
     id: int
-    name: str
-    air_date: str
-    overview: str
-    episode_count: int
+    name: str = ''
+    air_date: Optional[str] = None
+    overview: str = ''
+    episode_count: int = 0
     poster_path: str = ''
     season_number: int = 0
 
 
+@slotted
+@dataclass
+class SeasonDetails:
+    id: int
+    name: str
+    season_number: int
+    air_date: Optional[str] = None
+    overview: str = ''
+    poster_path: Optional[str] = None
+    vote_average: float = 0.0
+    episodes: Sequence[EpisodeInfo] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SeasonDetails:
+        episodes = [decode(EpisodeInfo, ep) for ep in data.get('episodes', [])]
+        return decode(cls, data, episodes=episodes)
+
+    @staticmethod
+    async def _fetch_batch(
+        session: aiohttp.ClientSession,
+        api_key: str,
+        tvshow_id: Any,
+        numbers: Sequence[int],
+        semaphore: asyncio.Semaphore,
+    ) -> MediaNotFound | Dict[int, SeasonDetails]:
+        params = {
+            'api_key': api_key,
+            'append_to_response': ','.join(f'season/{n}' for n in numbers),
+        }
+        try:
+            async with semaphore, tmdb_get(
+                session, f'{API_BASE}/tv/{tvshow_id}', params=params
+            ) as resp:
+                if resp.status in [401, 404]:
+                    err_data = await resp.json()
+                    return MediaNotFound(err_data['status_message'], resp.status)
+                if resp.status != 200:
+                    return MediaNotFound('', resp.status)
+                data = await resp.json()
+        except RateLimited:
+            return MediaNotFound('⚠️ Too many requests to TMDB right now, try again in a moment.', 429)
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            return MediaNotFound('⚠️ Operation timed out.', 408)
+        return {
+            n: SeasonDetails.from_dict(data[f'season/{n}'])
+            for n in numbers
+            if data.get(f'season/{n}')
+        }
+
+    @classmethod
+    @single_flight
+    async def request(
+        cls,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        tvshow_id: Any,
+        season_numbers: Sequence[int],
+    ) -> MediaNotFound | List[SeasonDetails]:
+        """Fetch seasons with their episodes, 20 seasons per API call, a few calls at once.
+
+        Seasons already in the per show cache are not requested again.
+        """
+        seasons = SEASONS_CACHE.get(str(tvshow_id)) or {}
+        missing = [n for n in season_numbers if n not in seasons]
+        semaphore = asyncio.Semaphore(SEASON_CALLS_IN_FLIGHT)
+        batches = await asyncio.gather(*(
+            cls._fetch_batch(
+                session, api_key, tvshow_id, missing[i:i + SEASONS_PER_CALL], semaphore
+            )
+            for i in range(0, len(missing), SEASONS_PER_CALL)
+        ))
+        for batch in batches:
+            if isinstance(batch, MediaNotFound):
+                return batch
+            seasons.update(batch)
+        if missing:
+            SEASONS_CACHE.set(str(tvshow_id), seasons)
+        return [seasons[n] for n in season_numbers if n in seasons]
+
+
+@slotted
 @dataclass
 class TVShowDetails:
     id: int
@@ -192,6 +330,9 @@ class TVShowDetails:
     production_companies: Sequence[ProductionCompany] = field(default_factory=list)
     production_countries: Sequence[ProductionCountry] = field(default_factory=list)
     spoken_languages: Sequence[SpokenLanguage] = field(default_factory=list)
+    recommendations: Sequence[TVShowSuggestions] = field(default_factory=list)
+    similar: Sequence[TVShowSuggestions] = field(default_factory=list)
+    external_ids: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def all_genres(self) -> str:
@@ -209,6 +350,10 @@ class TVShowDetails:
     def all_spoken_languages(self) -> str:
         return ', '.join([g.name for g in self.spoken_languages])
 
+    @property
+    def suggestions(self) -> Sequence[TVShowSuggestions]:
+        return self.recommendations or self.similar
+
     @property
     def all_networks(self) -> str:
         return ', '.join([g.name for g in self.networks])
@@ -249,25 +394,29 @@ class TVShowDetails:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> TVShowDetails:
-        n_eta = data.pop('next_episode_to_air', {})
-        l_eta = data.pop('last_episode_to_air', {})
-        created_by = [Creator(**c) for c in data.pop('created_by', [])]
-        credits = [CelebrityCast(**ccs) for ccs in data.pop('credits', {}).get('cast', [])]
-        genres = [Genre(**g) for g in data.pop('genres', [])]
-        seasons = [Season(**s) for s in data.pop('seasons', [])]
-        networks = [Network(**n) for n in data.pop('networks', [])]
+        n_eta = data.get('next_episode_to_air', {})
+        l_eta = data.get('last_episode_to_air', {})
+        created_by = [decode(Creator, c) for c in data.get('created_by', [])]
+        credits = [decode(CelebrityCast, ccs) for ccs in data.get('credits', {}).get('cast', [])]
+        genres = [decode(Genre, g) for g in data.get('genres', [])]
+        seasons = [decode(Season, s) for s in data.get('seasons', [])]
+        networks = [decode(Network, n) for n in data.get('networks', [])]
         production_companies = [
-            ProductionCompany(**pcom) for pcom in data.pop('production_companies', [])
+            decode(ProductionCompany, pcom) for pcom in data.get('production_companies', [])
         ]
         production_countries = [
-            ProductionCountry(**pctr) for pctr in data.pop('production_countries', [])
+            decode(ProductionCountry, pctr) for pctr in data.get('production_countries', [])
         ]
         spoken_languages = [
-            SpokenLanguage(**sl) for sl in data.pop('spoken_languages', [])
+            decode(SpokenLanguage, sl) for sl in data.get('spoken_languages', [])
         ]
-        return cls(
-            next_episode_to_air=EpisodeInfo(**n_eta) if n_eta else None,
-            last_episode_to_air=EpisodeInfo(**l_eta) if l_eta else None,
+        recommendations = TVShowSuggestions.from_results(data.get('recommendations'))
+        similar = TVShowSuggestions.from_results(data.get('similar'))
+        return decode(
+            cls,
+            data,
+            next_episode_to_air=decode(EpisodeInfo, n_eta) if n_eta else None,
+            last_episode_to_air=decode(EpisodeInfo, l_eta) if l_eta else None,
             created_by=created_by,
             credits=credits,
             genres=genres,
@@ -276,27 +425,41 @@ class TVShowDetails:
             production_companies=production_companies,
             production_countries=production_countries,
             spoken_languages=spoken_languages,
-            **data
+            recommendations=recommendations,
+            similar=similar,
+            external_ids=data.get('external_ids', {}),
         )
 
     @classmethod
+    @single_flight
     async def request(
         cls,
         session: aiohttp.ClientSession,
         api_key: str,
-        tvshow_id: Any
+        tvshow_id: Any,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> MediaNotFound | TVShowDetails:
+        if cached := DETAILS_CACHE.get(('tv', str(tvshow_id))):
+            return cached
+
         tvshow_data = {}
-        params = {'api_key': api_key, 'append_to_response': 'credits'}
+        params = {'api_key': api_key, 'append_to_response': APPEND_TO_RESPONSE}
         try:
-            async with session.get(f'{API_BASE}/tv/{tvshow_id}', params=params) as resp:
+            async with tmdb_get(
+                session, f'{API_BASE}/tv/{tvshow_id}', params=params, priority=priority
+            ) as resp:
                 if resp.status in [401, 404]:
                     err_data = await resp.json()
                     return MediaNotFound(err_data['status_message'], resp.status)
                 if resp.status != 200:
                     return MediaNotFound('', resp.status)
                 tvshow_data = await resp.json()
+        except RateLimited:
+            return MediaNotFound('⚠️ Too many requests to TMDB right now, try again in a moment.', 429)
         except (asyncio.TimeoutError, aiohttp.ClientError):
             return MediaNotFound('⚠️ Operation timed out.', 408)
 
-        return cls.from_dict(tvshow_data)
\ No newline at end of file
+        tvshow = cls.from_dict(tvshow_data)
+        DETAILS_CACHE.set(('tv', str(tvshow_id)), tvshow)
+        return tvshow
\ No newline at end of file
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, List, Literal, Optional
+
+import aiohttp
+
+from .base import API_BASE
+from .client import Priority, RateLimited, tmdb_get
+
+log = logging.getLogger("red.owo.moviedb.images")
+
+ImageKind = Literal["backdrop", "logo", "poster", "profile", "still"]
+EmbedSlot = Literal["icon", "thumbnail", "image"]
+
+# rendered width of each embed slot on Discord (24, 80 and ~400px), roughly doubled for HiDPI
+SLOT_WIDTHS: Dict[str, int] = {"icon": 48, "thumbnail": 160, "image": 780}
+
+# what /configuration returned at the time of writing, used until it's fetched
+IMAGE_BASE = "https://image.tmdb.org/t/p/"
+IMAGE_SIZES: Dict[str, List[str]] = {
+    "backdrop": ["w300", "w780", "w1280", "original"],
+    "logo": ["w45", "w92", "w154", "w185", "w300", "w500", "original"],
+    "poster": ["w92", "w154", "w185", "w342", "w500", "w780", "original"],
+    "profile": ["w45", "w185", "h632", "original"],
+    "still": ["w92", "w185", "w300", "original"],
+}
+_PICKED: Dict[tuple, str] = {}
+
+
+def _pick_size(kind: str, slot: str) -> str:
+    """Smallest width variant that is at least as wide as the slot, else the largest one."""
+    target = SLOT_WIDTHS[slot]
+    widths = sorted(
+        int(size[1:]) for size in IMAGE_SIZES.get(kind, []) if size[0] == "w" and size[1:].isdigit()
+    )
+    for width in widths:
+        if width >= target:
+            return f"w{width}"
+    return f"w{widths[-1]}" if widths else "original"
+
+
+def image_url(path: Optional[str], kind: ImageKind, slot: EmbedSlot) -> str:
+    """TMDB CDN URL of an image, sized for where it's shown in an embed."""
+    size = _PICKED.get((kind, slot))
+    if size is None:
+        size = _PICKED[(kind, slot)] = _pick_size(kind, slot)
+    return f"{IMAGE_BASE}{size}{path or '/'}"
+
+
+async def load_image_config(session: aiohttp.ClientSession, api_key: str) -> bool:
+    """Fetch the CDN base URL and size variants from TMDB's /configuration endpoint."""
+    global IMAGE_BASE
+    try:
+        async with tmdb_get(
+            session,
+            f"{API_BASE}/configuration",
+            params={"api_key": api_key},
+            priority=Priority.BACKGROUND,
+        ) as resp:
+            if resp.status != 200:
+                log.info("TMDB /configuration returned HTTP %s", resp.status)
+                return False
+            data = await resp.json()
+    except (asyncio.TimeoutError, aiohttp.ClientError, RateLimited):
+        return False
+
+    images = data.get("images", {})
+    IMAGE_BASE = images.get("secure_base_url") or IMAGE_BASE
+    for kind in IMAGE_SIZES:
+        if sizes := images.get(f"{kind}_sizes"):
+            IMAGE_SIZES[kind] = sizes
+    _PICKED.clear()
+    return True
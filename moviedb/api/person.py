@@ -1,14 +1,68 @@
 from __future__ import annotations
 import asyncio
+import heapq
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, TypeVar, overload
 
 import aiohttp
 
-from .base import API_BASE, CDN_BASE, MediaNotFound as NotFound
+from .base import API_BASE, MediaNotFound as NotFound, decode, slotted
+from .client import Priority, RateLimited, single_flight, tmdb_get
+from .images import image_url
 
+T = TypeVar("T")
 
+
+def _release_date(credit: Dict[str, Any]) -> str:
+    return credit.get('release_date', '') or credit.get('first_air_date', '')
+
+
+class LazyCredits(Sequence[T], Generic[T]):
+    """Raw credits that are only turned into dataclasses once they're looked at.
+
+    Prolific people have thousands of credits while ``[p]celebrity`` shows just
+    the newest 20, so a head slice like ``credits[:20]`` is served by a partial
+    top-K selection rather than by sorting and parsing everything.
+    """
+
+    def __init__(self, raw: List[Dict[str, Any]], factory: Callable[[Dict[str, Any]], T]) -> None:
+        self._raw = raw
+        self._factory = factory
+        self._head: List[T] = []
+        self._sorted: Optional[List[T]] = None
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> T | List[T]:
+        if self._sorted is None and isinstance(index, slice):
+            start, stop, step = index.indices(len(self._raw))
+            if start == 0 and step == 1 and stop < len(self._raw):
+                if stop > len(self._head):
+                    top = heapq.nlargest(stop, self._raw, key=_release_date)
+                    self._head = [self._factory(credit) for credit in top]
+                return self._head[:stop]
+        return self._materialize()[index]
+
+    def _materialize(self) -> List[T]:
+        if self._sorted is None:
+            self._sorted = [
+                self._factory(credit)
+                for credit in sorted(self._raw, key=_release_date, reverse=True)
+            ]
+        return self._sorted
+
+
+@slotted
 @dataclass
 class BaseCredits:
     id: int
@@ -28,6 +82,7 @@ class BaseCredits:
         return date.split("-")[0] if date and "-" in date else ""
 
 
+@slotted
 @dataclass
 class CastCredits(BaseCredits):
     character: str = ""
@@ -38,52 +93,35 @@ class CastCredits(BaseCredits):
 
     @classmethod
     def from_data(cls, data: dict) -> CastCredits:
-        for key in [
-            "credit_id", "adult", "video", "original_language", "overview", "popularity",
-            "order", "vote_average", "vote_count", "backdrop_path", "poster_path", "genre_ids"
-        ]:
-            data.pop(key, None)
-        return cls(**data)
+        return decode(cls, data)
 
 
+@slotted
 @dataclass
 class CrewCredits(BaseCredits):
     department: str = ""
     job: str = ""
 
     @classmethod
-    def from_data(cls, data: dict) -> CastCredits:
-        for key in [
-            "credit_id", "adult", "video", "original_language", "overview", "popularity",
-            "order", "vote_average", "vote_count", "backdrop_path", "poster_path", "genre_ids"
-        ]:
-            data.pop(key, None)
-        return cls(**data)
+    def from_data(cls, data: dict) -> CrewCredits:
+        return decode(cls, data)
 
 
+@slotted
 @dataclass
 class PersonCredits:
-    cast: List[CastCredits] = field(default_factory=list)
-    crew: List[CrewCredits] = field(default_factory=list)
+    cast: Sequence[CastCredits] = field(default_factory=list)
+    crew: Sequence[CrewCredits] = field(default_factory=list)
 
     @classmethod
     def from_data(cls, data: dict) -> PersonCredits:
-        cast_data = data.pop("cast", [])
-        crew_data = data.pop("crew", [])
-        cast_data.sort(
-            key=lambda x: x.get('release_date', '') or x.get('first_air_date', ''),
-            reverse=True
-        )
-        crew_data.sort(
-            key=lambda x: x.get('release_date', '') or x.get('first_air_date', ''),
-            reverse=True
-        )
         return cls(
-            cast=[CastCredits.from_data(csc) for csc in cast_data] if cast_data else [],
-            crew=[CrewCredits.from_data(crw) for crw in crew_data] if crew_data else []
+            cast=LazyCredits(data.get("cast", []), CastCredits.from_data),
+            crew=LazyCredits(data.get("crew", []), CrewCredits.from_data),
         )
 
 
+@slotted
 @dataclass
 class Person:
     id: int
@@ -104,31 +142,42 @@ class Person:
 
     @property
     def person_image(self) -> str:
-        return f"{CDN_BASE}{self.profile_path}" if self.profile_path else ""
+        return image_url(self.profile_path, "profile", "thumbnail") if self.profile_path else ""
+
+    @property
+    def person_icon(self) -> str:
+        return image_url(self.profile_path, "profile", "icon") if self.profile_path else ""
 
     @classmethod
     def from_data(cls, data: dict) -> Person:
-        credits = data.pop("combined_credits", {})
-        return cls(combined_credits=PersonCredits.from_data(credits), **data)
+        credits = PersonCredits.from_data(data.get("combined_credits", {}))
+        return decode(cls, data, combined_credits=credits)
 
     @classmethod
+    @single_flight
     async def request(
         cls,
         session: aiohttp.ClientSession,
         api_key: str,
-        person_id: str
+        person_id: str,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> Person | NotFound:
         try:
-            async with session.get(
+            async with tmdb_get(
+                session,
                 f"{API_BASE}/person/{person_id}",
-                params={"api_key": api_key, "append_to_response": "combined_credits"}
+                params={"api_key": api_key, "append_to_response": "combined_credits"},
+                priority=priority,
             ) as resp:
                 if resp.status in [401, 404]:
                     data = await resp.json()
-                    return NotFound(**data)
+                    return decode(NotFound, data, http_code=resp.status)
                 if resp.status != 200:
                     return NotFound("No results found.", resp.status)
                 person_data = await resp.json()
+        except RateLimited:
+            return NotFound("⚠️ Too many requests to TMDB right now, try again in a moment.", 429)
         except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
             return NotFound("Operation timed out!", 408)
 
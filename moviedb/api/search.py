@@ -5,9 +5,11 @@ from typing import Optional, List
 
 import aiohttp
 
-from .base import BaseSearch, MediaNotFound, multi_search
+from .base import BaseSearch, MediaNotFound, decode, multi_search, slotted
+from .client import Priority
 
 
+@slotted
 @dataclass
 class PersonSearch:
     id: int
@@ -34,9 +36,11 @@ class PersonSearch:
         cls,
         session: aiohttp.ClientSession,
         api_key: str,
-        query: str
+        query: str,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> MediaNotFound | List[PersonSearch]:
-        all_data = await multi_search(session, api_key, query)
+        all_data = await multi_search(session, api_key, query, priority=priority)
         if isinstance(all_data, MediaNotFound):
             return all_data
         filtered_data = [media for media in all_data if media.get("media_type") == "person"]
@@ -44,9 +48,10 @@ class PersonSearch:
             return MediaNotFound("❌ No results.", 404)
 
         # filtered_data.sort(key=lambda x: x.get('name'))
-        return [cls(**person) for person in filtered_data]
+        return [decode(cls, person) for person in filtered_data]
 
 
+@slotted
 @dataclass
 class MovieSearch(BaseSearch):
     title: str = ''
@@ -61,9 +66,11 @@ class MovieSearch(BaseSearch):
         cls,
         session: aiohttp.ClientSession,
         api_key: str,
-        query: str
+        query: str,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> MediaNotFound | List[MovieSearch]:
-        all_data = await multi_search(session, api_key, query)
+        all_data = await multi_search(session, api_key, query, priority=priority)
         if isinstance(all_data, MediaNotFound):
             return all_data
         filtered_data = [media for media in all_data if media.get("media_type") == "movie"]
@@ -71,9 +78,10 @@ class MovieSearch(BaseSearch):
             return MediaNotFound("❌ No results.", 404)
 
         filtered_data.sort(key=lambda x: x.get('release_date'), reverse=True)
-        return [cls(**movie) for movie in filtered_data]
+        return [decode(cls, movie) for movie in filtered_data]
 
 
+@slotted
 @dataclass
 class TVShowSearch(BaseSearch):
     name: str = ''
@@ -87,9 +95,11 @@ class TVShowSearch(BaseSearch):
         cls,
         session: aiohttp.ClientSession,
         api_key: str,
-        query: str
+        query: str,
+        *,
+        priority: Priority = Priority.INTERACTIVE,
     ) -> MediaNotFound | List[TVShowSearch]:
-        all_data = await multi_search(session, api_key, query)
+        all_data = await multi_search(session, api_key, query, priority=priority)
         if isinstance(all_data, MediaNotFound):
             return all_data
         filtered_data = [media for media in all_data if media.get("media_type") == "tv"]
@@ -97,4 +107,4 @@ class TVShowSearch(BaseSearch):
             return MediaNotFound("❌ No results.", 404)
 
         filtered_data.sort(key=lambda x: x.get('first_air_date'), reverse=True)
-        return [cls(**tvshow) for tvshow in filtered_data]
+        return [decode(cls, tvshow) for tvshow in filtered_data]
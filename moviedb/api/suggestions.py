@@ -1,34 +1,35 @@
 from __future__ import annotations
 
-import asyncio
-from dataclasses import dataclass
-from typing import Any, Dict, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
 
-import aiohttp
 from redbot.core.utils.chat_formatting import humanize_number
 
-from .base import API_BASE, MediaNotFound
+from .base import decode, slotted
 
 
+@slotted
 @dataclass
 class BaseSuggestions:
+    # only the ID is guaranteed, TMDB leaves out or nulls the rest on sparse entries
     id: int
-    adult: bool
-    overview: str
-    original_language: str
-    media_type: str
-    popularity: float
-    vote_count: int
-    vote_average: float
-    genre_ids: Sequence[int]
+    adult: bool = False
+    overview: str = ''
+    original_language: str = ''
+    media_type: str = ''
+    popularity: float = 0.0
+    vote_count: int = 0
+    vote_average: float = 0.0
+    genre_ids: Sequence[int] = field(default_factory=list)
 
 
+@slotted
 @dataclass
 class MovieSuggestions(BaseSuggestions):
-    title: str
-    original_title: str
-    release_date: str
-    video: bool
+    title: str = ''
+    original_title: str = ''
+    release_date: str = ''
+    video: bool = False
     backdrop_path: str = ''
     poster_path: str = ''
 
@@ -38,40 +39,21 @@ class MovieSuggestions(BaseSuggestions):
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> MovieSuggestions:
-        genre_ids = data.pop('genre_ids', [])
-        return cls(genre_ids=genre_ids, **data)
+        # `similar` results don't come with a media_type, unlike `recommendations`
+        return decode(cls, {'media_type': 'movie', 'genre_ids': [], **data})
 
     @classmethod
-    async def request(
-        cls,
-        session: aiohttp.ClientSession,
-        api_key: str,
-        movie_id: Any
-    ) -> MediaNotFound | Sequence[MovieSuggestions]:
-        url = f"{API_BASE}/movie/{movie_id}/recommendations"
-        try:
-            async with session.get(url, params={"api_key": api_key}) as resp:
-                if resp.status in [401, 404]:
-                    err_data = await resp.json()
-                    return MediaNotFound(err_data['status_message'], resp.status)
-                if resp.status != 200:
-                    return MediaNotFound('', resp.status)
-                data = await resp.json()
-        except (aiohttp.ClientError, asyncio.TimeoutError):
-            return MediaNotFound('⚠️ Operation timed out.', 408)
-
-        if not data.get('results') or data['total_results'] < 1:
-            return MediaNotFound('❌ No recommendations found related to that movie.', 404)
-
-        return [cls.from_json(obj) for obj in data['results']]
+    def from_results(cls, data: Optional[Dict[str, Any]]) -> List[MovieSuggestions]:
+        return decode_results(cls, data)
 
 
+@slotted
 @dataclass
 class TVShowSuggestions(BaseSuggestions):
-    name: str
-    original_name: str
-    first_air_date: str
-    origin_country: Sequence[str]
+    name: str = ''
+    original_name: str = ''
+    first_air_date: str = ''
+    origin_country: Sequence[str] = field(default_factory=list)
     backdrop_path: str = ''
     poster_path: str = ''
 
@@ -81,30 +63,24 @@ class TVShowSuggestions(BaseSuggestions):
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> TVShowSuggestions:
-        genre_ids = data.pop('genre_ids', [])
-        origin_country = data.pop('origin_country', [])
-        return cls(origin_country=origin_country, genre_ids=genre_ids, **data)
+        defaults = {'media_type': 'tv', 'adult': False, 'genre_ids': [], 'origin_country': []}
+        return decode(cls, {**defaults, **data})
 
     @classmethod
-    async def request(
-        cls,
-        session: aiohttp.ClientSession,
-        api_key: str,
-        tmdb_id: Any
-    ) -> MediaNotFound | Sequence[TVShowSuggestions]:
-        url = f"{API_BASE}/tv/{tmdb_id}/recommendations"
+    def from_results(cls, data: Optional[Dict[str, Any]]) -> List[TVShowSuggestions]:
+        return decode_results(cls, data)
+
+
+def decode_results(cls: Any, data: Optional[Dict[str, Any]]) -> List[Any]:
+    """Suggestions from an appended ``recommendations``/``similar`` page.
+
+    Entries that still can't be decoded are skipped, so one malformed suggestion
+    doesn't fail the whole details request it came with.
+    """
+    suggestions = []
+    for result in (data or {}).get('results') or []:
         try:
-            async with session.get(url, params={"api_key": api_key}) as resp:
-                if resp.status in [401, 404]:
-                    err_data = await resp.json()
-                    return MediaNotFound(err_data['status_message'], resp.status)
-                if resp.status != 200:
-                    return MediaNotFound('', resp.status)
-                data = await resp.json()
-        except (aiohttp.ClientError, asyncio.TimeoutError):
-            return MediaNotFound('⚠️ Operation timed out.', 408)
-
-        if not data.get('results') or data['total_results'] < 1:
-            return MediaNotFound('❌ No recommendations found related to that TV show.', 404)
-
-        return [cls.from_json(obj) for obj in data['results']]
\ No newline at end of file
+            suggestions.append(cls.from_json(result))
+        except (TypeError, KeyError):
+            continue
+    return suggestions
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+import aiohttp
+
+from .base import API_BASE, MediaNotFound
+from .client import Priority, RateLimited, tmdb_get
+from .details import MovieDetails, TVShowDetails
+
+log = logging.getLogger("red.owo.moviedb.trending")
+
+# TMDB trending endpoint returns 20 titles per page
+TRENDING_PAGE_SIZE = 20
+
+
+async def fetch_trending(
+    session: aiohttp.ClientSession, api_key: str, limit: int
+) -> List[Dict[str, Any]]:
+    """Today's trending movies and TV shows, most popular first (people are skipped)."""
+    titles: List[Dict[str, Any]] = []
+    page = 1
+    while len(titles) < limit:
+        try:
+            async with tmdb_get(
+                session,
+                f"{API_BASE}/trending/all/day",
+                params={"api_key": api_key, "page": page},
+                priority=Priority.BACKGROUND,
+            ) as resp:
+                if resp.status != 200:
+                    log.info("TMDB trending endpoint returned HTTP %s", resp.status)
+                    break
+                data = await resp.json()
+        except (asyncio.TimeoutError, aiohttp.ClientError, RateLimited):
+            break
+        titles.extend(x for x in data.get("results", []) if x.get("media_type") in ("movie", "tv"))
+        if page >= data.get("total_pages", 1):
+            break
+        page += 1
+    return titles[:limit]
+
+
+async def prewarm_trending(
+    session: aiohttp.ClientSession, api_key: str, budget: int, *, concurrency: int = 3
+) -> int:
+    """Fetch details (with credits and suggestions) for the top ``budget`` trending titles.
+
+    Each title costs one request, which lands in the detail cache. Requests go
+    out at background priority with at most ``concurrency`` in flight, so real
+    users queued on the rate limiter are always served first.
+    Returns the number of titles that were fetched successfully.
+    """
+    trending = await fetch_trending(session, api_key, budget)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def warm(item: Dict[str, Any]) -> bool:
+        details = MovieDetails if item["media_type"] == "movie" else TVShowDetails
+        async with semaphore:
+            result = await details.request(
+                session, api_key, item["id"], priority=Priority.BACKGROUND
+            )
+        return not isinstance(result, MediaNotFound)
+
+    warmed = sum(await asyncio.gather(*(warm(item) for item in trending)))
+    log.debug("Pre-warmed %s of %s trending TMDB titles", warmed, len(trending))
+    return warmed
@@ -4,25 +4,93 @@ import asyncio
 import contextlib
 from datetime import datetime
 from textwrap import shorten
-from typing import List, cast
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, cast
 
+import aiohttp
 import discord
 from redbot.core.bot import Red
 from redbot.core.commands import BadArgument, Context
 
 from .api.base import MediaNotFound
+from .api.client import Priority
 from .api.details import MovieDetails, TVShowDetails
 from .api.person import Person as PersonDetails
 from .api.search import MovieSearch, PersonSearch, TVShowSearch
-from .api.suggestions import MovieSuggestions, TVShowSuggestions
 from .utils import format_date
 
+# how many of the top search results to fetch while the choice prompt is open
+PREFETCH_TOP = 3
+# most autocomplete choices shown at once
+CHOICE_LIMIT = 24
+
+
+async def local_choices(
+    bot: Red, kind: str, value: int | float | str
+) -> List[discord.app_commands.Choice]:
+    """Autocomplete choices answered from the offline TMDB title index, if it's built."""
+    index = bot.get_cog('MovieDB').title_index
+    return [
+        discord.app_commands.Choice(name=shorten(name, 96, placeholder=' …'), value=str(tmdb_id))
+        for tmdb_id, name in await index.search(kind, str(value), CHOICE_LIMIT)
+    ]
+
+
+def merge_choices(
+    remote: List[discord.app_commands.Choice], local: List[discord.app_commands.Choice]
+) -> List[discord.app_commands.Choice]:
+    """TMDB search results first, as they match localised titles too, then other local hits."""
+    seen = {choice.value for choice in remote}
+    return (remote + [choice for choice in local if choice.value not in seen])[:CHOICE_LIMIT]
+
+
+class Prefetch:
+    """Fetches details for the top few search results while the user is still choosing.
+
+    Prefetches go out at background priority, so they only use rate limit tokens
+    nobody else wants. Picking one that hasn't finished yet takes its request over
+    at interactive priority (see :func:`single_flight`) rather than sending another.
+    """
+
+    def __init__(
+        self,
+        request: Callable[..., Awaitable[Any]],
+        session: aiohttp.ClientSession,
+        api_key: str,
+        ids: Sequence[int],
+    ) -> None:
+        self.request = request
+        self.session = session
+        self.api_key = api_key
+        self.tasks: Dict[int, asyncio.Task] = {
+            tmdb_id: asyncio.create_task(
+                request(session, api_key, tmdb_id, priority=Priority.BACKGROUND)
+            )
+            for tmdb_id in ids[:PREFETCH_TOP]
+        }
+
+    def cancel(self) -> None:
+        for task in self.tasks.values():
+            task.cancel()
+        self.tasks.clear()
+
+    async def get(self, tmdb_id: int) -> Any:
+        task = self.tasks.pop(tmdb_id, None)
+        self.cancel()
+        if task is not None and task.done() and not task.cancelled():
+            result = task.result()
+            if not isinstance(result, MediaNotFound):
+                return result
+        elif task is not None:
+            # only our handle is cancelled, the shared request joins the one below
+            task.cancel()
+        return await self.request(self.session, self.api_key, tmdb_id)
+
 
 class PersonFinder(discord.app_commands.Transformer):
 
     async def convert(self, ctx: Context, argument: str):
         session = ctx.bot.get_cog('MovieDB').session
-        api_key = (await ctx.bot.get_shared_api_tokens("tmdb")).get("api_key", "")
+        api_key = ctx.bot.get_cog('MovieDB').api_key
         results = await PersonSearch.request(session, api_key, argument.lower())
         if isinstance(results, MediaNotFound):
             raise BadArgument(str(results))
@@ -31,6 +99,8 @@ class PersonFinder(discord.app_commands.Transformer):
         if len(results) == 1:
             return await PersonDetails.request(session, api_key, results[0].id)
 
+        prefetch = Prefetch(PersonDetails.request, session, api_key, [x.id for x in results])
+
         items = [
             f"**{i}.**  {obj.name} {obj.notable_roles}" for i, obj in enumerate(results, 1)
         ]
@@ -53,6 +123,7 @@ class PersonFinder(discord.app_commands.Transformer):
             choice = None
 
         if choice is None or (choice.content and choice.content.strip() == "0"):
+            prefetch.cancel()
             with contextlib.suppress(discord.NotFound, discord.HTTPException):
                 await prompt.delete()
             raise BadArgument("‼ You didn't pick a valid choice. Operation cancelled.")
@@ -60,23 +131,30 @@ class PersonFinder(discord.app_commands.Transformer):
         with contextlib.suppress(discord.NotFound, discord.HTTPException):
             await prompt.delete()
         person_id = results[int(choice.content.strip()) - 1].id
-        return await PersonDetails.request(session, api_key, person_id)
+        return await prefetch.get(person_id)
 
     async def transform(self, interaction: discord.Interaction, value: str):
         bot = cast(Red, interaction.client)
         session = bot.get_cog('MovieDB').session
-        key = (await bot.get_shared_api_tokens('tmdb')).get('api_key', '')
+        key = bot.get_cog('MovieDB').api_key
         return await PersonDetails.request(session, key, value)
 
     async def autocomplete(
         self, interaction: discord.Interaction, value: int | float | str
     ) -> List[discord.app_commands.Choice]:
         bot = cast(Red, interaction.client)
+        # the index only has original titles, so a full page of hits is needed to skip TMDB
+        local = await local_choices(bot, 'person', value)
+        if len(local) >= CHOICE_LIMIT:
+            return local
+
         session = bot.get_cog('MovieDB').session
-        token = (await bot.get_shared_api_tokens('tmdb')).get('api_key', '')
-        results = await PersonSearch.request(session, token, str(value))
+        token = bot.get_cog('MovieDB').api_key
+        results = await PersonSearch.request(
+            session, token, str(value), priority=Priority.AUTOCOMPLETE
+        )
         if not results or isinstance(results, MediaNotFound):
-            return []
+            return local
 
         choices = [
             discord.app_commands.Choice(
@@ -84,14 +162,14 @@ class PersonFinder(discord.app_commands.Transformer):
             )
             for person in results
         ]
-        return choices[:24]
+        return merge_choices(choices, local)
 
 
 class MovieFinder(discord.app_commands.Transformer):
 
     async def convert(self, ctx: Context, argument: str):
         session = ctx.bot.get_cog('MovieDB').session
-        api_key = (await ctx.bot.get_shared_api_tokens("tmdb")).get("api_key", "")
+        api_key = ctx.bot.get_cog('MovieDB').api_key
         results = await MovieSearch.request(session, api_key, argument.lower())
         if isinstance(results, MediaNotFound):
             raise BadArgument(str(results))
@@ -100,6 +178,8 @@ class MovieFinder(discord.app_commands.Transformer):
         if len(results) == 1:
             return await MovieDetails.request(session, api_key, results[0].id)
 
+        prefetch = Prefetch(MovieDetails.request, session, api_key, [x.id for x in results])
+
         # https://github.com/Sitryk/sitcogsv3/blob/master/lyrics/lyrics.py#L142
         items = [
             f"**{i}.**  {obj.title} ({format_date(obj.release_date, 'd')})"
@@ -124,6 +204,7 @@ class MovieFinder(discord.app_commands.Transformer):
             choice = None
 
         if choice is None or (choice.content and choice.content.strip() == "0"):
+            prefetch.cancel()
             with contextlib.suppress(discord.NotFound, discord.HTTPException):
                 await prompt.delete()
             raise BadArgument("‼ You didn't pick a valid choice. Operation cancelled.")
@@ -131,25 +212,30 @@ class MovieFinder(discord.app_commands.Transformer):
         with contextlib.suppress(discord.NotFound, discord.HTTPException):
             await prompt.delete()
         movie_id = results[int(choice.content.strip()) - 1].id
-        return await MovieDetails.request(session, api_key, movie_id)
+        return await prefetch.get(movie_id)
 
     async def transform(self, interaction: discord.Interaction, value: str):
         bot = cast(Red, interaction.client)
         session = bot.get_cog('MovieDB').session
-        key = (await bot.get_shared_api_tokens('tmdb')).get('api_key', '')
-        if 'suggest' in interaction.command.name:
-            return await MovieSuggestions.request(session, key, value)
+        key = bot.get_cog('MovieDB').api_key
         return await MovieDetails.request(session, key, value)
 
     async def autocomplete(
         self, interaction: discord.Interaction, value: int | float | str
     ) -> List[discord.app_commands.Choice]:
         bot = cast(Red, interaction.client)
+        # the index only has original titles, so a full page of hits is needed to skip TMDB
+        local = await local_choices(bot, 'movie', value)
+        if len(local) >= CHOICE_LIMIT:
+            return local
+
         session = bot.get_cog('MovieDB').session
-        token = (await bot.get_shared_api_tokens('tmdb')).get('api_key', '')
-        results = await MovieSearch.request(session, token, str(value))
+        token = bot.get_cog('MovieDB').api_key
+        results = await MovieSearch.request(
+            session, token, str(value), priority=Priority.AUTOCOMPLETE
+        )
         if not results or isinstance(results, MediaNotFound):
-            return []
+            return local
 
         def parser(title: str, date: str) -> str:
             if not date:
@@ -164,14 +250,14 @@ class MovieFinder(discord.app_commands.Transformer):
             )
             for movie in results
         ]
-        return choices[:24]
+        return merge_choices(choices, local)
 
 
 class TVShowFinder(discord.app_commands.Transformer):
 
     async def convert(self, ctx: Context, argument: str):
         session = ctx.bot.get_cog('MovieDB').session
-        api_key = (await ctx.bot.get_shared_api_tokens("tmdb")).get("api_key", "")
+        api_key = ctx.bot.get_cog('MovieDB').api_key
         results = await TVShowSearch.request(session, api_key, argument.lower())
         if isinstance(results, MediaNotFound):
             raise BadArgument(str(results))
@@ -180,6 +266,8 @@ class TVShowFinder(discord.app_commands.Transformer):
         if len(results) == 1:
             return await TVShowDetails.request(session, api_key, results[0].id)
 
+        prefetch = Prefetch(TVShowDetails.request, session, api_key, [x.id for x in results])
+
         # https://github.com/Sitryk/sitcogsv3/blob/master/lyrics/lyrics.py#L142
         items = [
             f"**{i}.**  {v.name or v.original_name}"
@@ -205,6 +293,7 @@ class TVShowFinder(discord.app_commands.Transformer):
             choice = None
 
         if choice is None or (choice.content and choice.content.strip() == "0"):
+            prefetch.cancel()
             with contextlib.suppress(discord.NotFound, discord.HTTPException):
                 await prompt.delete()
             raise BadArgument("‼ You didn't pick a valid choice. Operation cancelled.")
@@ -212,25 +301,30 @@ class TVShowFinder(discord.app_commands.Transformer):
         with contextlib.suppress(discord.NotFound, discord.HTTPException):
             await prompt.delete()
         tv_id = results[int(choice.content.strip()) - 1].id
-        return await TVShowDetails.request(session, api_key, tv_id)
+        return await prefetch.get(tv_id)
 
     async def transform(self, interaction: discord.Interaction, value: str):
         bot = cast(Red, interaction.client)
         session = bot.get_cog('MovieDB').session
-        key = (await bot.get_shared_api_tokens('tmdb')).get('api_key', '')
-        if 'suggest' in interaction.command.name:
-            return await TVShowSuggestions.request(session, key, value)
+        key = bot.get_cog('MovieDB').api_key
         return await TVShowDetails.request(session, key, value)
 
     async def autocomplete(
         self, interaction: discord.Interaction, value: int | float | str
     ) -> List[discord.app_commands.Choice]:
         bot = cast(Red, interaction.client)
+        # the index only has original titles, so a full page of hits is needed to skip TMDB
+        local = await local_choices(bot, 'tv', value)
+        if len(local) >= CHOICE_LIMIT:
+            return local
+
         session = bot.get_cog('MovieDB').session
-        token = (await bot.get_shared_api_tokens('tmdb')).get('api_key', '')
-        results = await TVShowSearch.request(session, token, str(value))
+        token = bot.get_cog('MovieDB').api_key
+        results = await TVShowSearch.request(
+            session, token, str(value), priority=Priority.AUTOCOMPLETE
+        )
         if not results or isinstance(results, MediaNotFound):
-            return []
+            return local
 
         def parser(title: str, date: str) -> str:
             if not date:
@@ -245,4 +339,4 @@ class TVShowFinder(discord.app_commands.Transformer):
             )
             for tvshow in results
         ]
-        return choices[:24]
+        return merge_choices(choices, local)
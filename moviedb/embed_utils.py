@@ -6,13 +6,15 @@ from typing import List, Sequence
 import discord
 from redbot.core.utils.chat_formatting import pagify
 
-from .api.base import CDN_BASE, CelebrityCast
-from .api.details import MovieDetails, TVShowDetails
+from .api.base import CelebrityCast
+from .api.details import MovieDetails, SeasonDetails, TVShowDetails
+from .api.images import image_url
 from .api.person import Person
 from .api.suggestions import MovieSuggestions, TVShowSuggestions
 from .utils import format_date, natural_size
 
 GENDERS = ["", "♀ ", "♂ ", "⚧ "]
+CAST_PER_PAGE = 15
 
 
 def make_person_embed(person: Person, colour: discord.Colour) -> discord.Embed:
@@ -47,8 +49,8 @@ def make_movie_embed(data: MovieDetails, colour: discord.Colour) -> discord.Embe
         description += f"\n\n**[see IMDB page!](https://www.imdb.com/title/{imdb_id})**"
     embed.url = f"https://www.themoviedb.org/movie/{data.id}"
     embed.description = description
-    embed.set_image(url=f"{CDN_BASE}{data.backdrop_path or '/'}")
-    embed.set_thumbnail(url=f"{CDN_BASE}{data.poster_path or '/'}")
+    embed.set_image(url=image_url(data.backdrop_path, "backdrop", "image"))
+    embed.set_thumbnail(url=image_url(data.poster_path, "poster", "thumbnail"))
     if data.release_date:
         embed.add_field(name="Release Date", value=format_date(data.release_date))
     if data.budget:
@@ -72,31 +74,54 @@ def make_movie_embed(data: MovieDetails, colour: discord.Colour) -> discord.Embe
     return embed
 
 
-def parse_credits(
+def make_movie_production_embed(data: MovieDetails, colour: discord.Colour) -> discord.Embed:
+    embed = discord.Embed(colour=colour, title=data.title)
+    embed.url = f"https://www.themoviedb.org/movie/{data.id}"
+    embed.set_image(url=image_url(data.backdrop_path, "backdrop", "image"))
+    if data.production_companies:
+        embed.add_field(name="Production Companies", value=data.all_production_companies)
+    if data.production_countries:
+        embed.add_field(
+            name="Production Countries",
+            value=data.all_production_countries,
+            inline=False,
+        )
+    if data.tagline:
+        embed.add_field(name="Tagline", value=data.tagline, inline=False)
+    if data.credits:
+        embed.set_footer(
+            text="See next page to see the celebrity cast!",
+            icon_url="https://i.imgur.com/sSE7Usn.png",
+        )
+    return embed
+
+
+def cast_page_count(cast_data: Sequence[CelebrityCast]) -> int:
+    return -(-len(cast_data) // CAST_PER_PAGE)
+
+
+def make_cast_embed(
     cast_data: Sequence[CelebrityCast],
     colour: discord.Colour,
     title: str,
-    tmdb_id: str
-) -> List[discord.Embed]:
+    tmdb_id: str,
+    page: int,
+) -> discord.Embed:
+    """Render a single page (0-indexed) of the cast list."""
+    start = page * CAST_PER_PAGE
     pretty_cast = "\n".join(
         f"**`[{i:>2}]`**  {GENDERS[actor.gender]} [{actor.name}]"
         f"(https://www.themoviedb.org/person/{actor.id})"
         f" as **{actor.character or '???'}**"
-        for i, actor in enumerate(cast_data, 1)
+        for i, actor in enumerate(cast_data[start:start + CAST_PER_PAGE], start + 1)
     )
-
-    pages = []
-    all_pages = list(pagify(pretty_cast, page_length=1500))
-    for i, page in enumerate(all_pages, start=1):
-        emb = discord.Embed(colour=colour, description=page, title=title)
-        emb.url = f"https://www.themoviedb.org/{tmdb_id}/cast"
-        emb.set_footer(
-            text=f"Celebrities Cast • Page {i} of {len(all_pages)}",
-            icon_url="https://i.imgur.com/sSE7Usn.png",
-        )
-        pages.append(emb)
-
-    return pages
+    emb = discord.Embed(colour=colour, description=pretty_cast, title=title)
+    emb.url = f"https://www.themoviedb.org/{tmdb_id}/cast"
+    emb.set_footer(
+        text=f"Celebrities Cast • Page {page + 1} of {cast_page_count(cast_data)}",
+        icon_url="https://i.imgur.com/sSE7Usn.png",
+    )
+    return emb
 
 
 def make_tvshow_embed(data: TVShowDetails, colour: discord.Colour) -> discord.Embed:
@@ -108,8 +133,8 @@ def make_tvshow_embed(data: TVShowDetails, colour: discord.Colour) -> discord.Em
         summary += f"► In production? ✅ Yes"
     embed.description=f"{data.overview or ''}\n\n{summary}"
     embed.url = f"https://www.themoviedb.org/tv/{data.id}"
-    embed.set_image(url=f"{CDN_BASE}{data.backdrop_path or '/'}")
-    embed.set_thumbnail(url=f"{CDN_BASE}{data.poster_path or '/'}")
+    embed.set_image(url=image_url(data.backdrop_path, "backdrop", "image"))
+    embed.set_thumbnail(url=image_url(data.poster_path, "poster", "thumbnail"))
     if data.created_by:
         embed.add_field(name="Creators", value=data.creators)
     if first_air_date := data.first_air_date:
@@ -140,13 +165,62 @@ def make_tvshow_embed(data: TVShowDetails, colour: discord.Colour) -> discord.Em
     return embed
 
 
+def make_tvshow_production_embed(data: TVShowDetails, colour: discord.Colour) -> discord.Embed:
+    embed = discord.Embed(colour=colour, title=data.name)
+    embed.url = f"https://www.themoviedb.org/tv/{data.id}"
+    embed.set_image(url=image_url(data.backdrop_path, "backdrop", "image"))
+    if data.production_countries:
+        embed.add_field(name="Production Countries", value=data.all_production_countries)
+    if data.production_companies:
+        embed.add_field(
+            name="Production Companies",
+            value=data.all_production_companies,
+            inline=False,
+        )
+    if data.tagline:
+        embed.add_field(name="Tagline", value=data.tagline, inline=False)
+    if data.credits:
+        embed.set_footer(
+            text="See next page to see this series' celebrity cast!",
+            icon_url="https://i.imgur.com/sSE7Usn.png",
+        )
+    return embed
+
+
+def make_season_embed(
+    show: TVShowDetails, season: SeasonDetails, colour: discord.Colour, footer: str,
+) -> discord.Embed:
+    embed = discord.Embed(colour=colour, title=f"{show.name} • {season.name}")
+    embed.url = f"https://www.themoviedb.org/tv/{show.id}/season/{season.season_number}"
+    embed.set_thumbnail(url=image_url(season.poster_path or show.poster_path, "poster", "thumbnail"))
+    summary = shorten(season.overview, 600, placeholder=" …") if season.overview else ""
+    if season.air_date:
+        summary += f"\n\n► First aired:  {format_date(season.air_date, 'D')}"
+    episodes = [
+        f"**`E{ep.episode_number:>02}`**  {ep.name}"
+        f"{format_date(ep.air_date or '', 'd', prefix=' • ')}"
+        + (f" • {ep.runtime} min" if ep.runtime else "")
+        for ep in season.episodes
+    ]
+    listing, shown = "", 0
+    for line in episodes:
+        if len(summary) + len(listing) + len(line) > 3900:
+            listing += f"… and {len(episodes) - shown} more episodes"
+            break
+        listing += line + "\n"
+        shown += 1
+    embed.description = f"{summary}\n\n{listing}".strip()
+    embed.set_footer(text=footer, icon_url="https://i.imgur.com/sSE7Usn.png")
+    return embed
+
+
 def make_suggestmovies_embed(
     data: MovieSuggestions, colour: discord.Colour, footer: str,
 ) -> discord.Embed:
     embed = discord.Embed(colour=colour, title=data.title, description=data.overview or "")
     embed.url = f"https://www.themoviedb.org/movie/{data.id}"
-    embed.set_image(url=f"{CDN_BASE}{data.backdrop_path or '/'}")
-    embed.set_thumbnail(url=f"{CDN_BASE}{data.poster_path or '/'}")
+    embed.set_image(url=image_url(data.backdrop_path, "backdrop", "image"))
+    embed.set_thumbnail(url=image_url(data.poster_path, "poster", "thumbnail"))
     if data.release_date:
         embed.add_field(name="Release Date", value=format_date(data.release_date))
     if data.vote_average and data.vote_count:
@@ -160,8 +234,8 @@ def make_suggestshows_embed(
 ) -> discord.Embed:
     embed = discord.Embed(title=data.name, description=data.overview or "", colour=colour)
     embed.url = f"https://www.themoviedb.org/tv/{data.id}"
-    embed.set_image(url=f"{CDN_BASE}{data.backdrop_path or '/'}")
-    embed.set_thumbnail(url=f"{CDN_BASE}{data.poster_path or '/'}")
+    embed.set_image(url=image_url(data.backdrop_path, "backdrop", "image"))
+    embed.set_thumbnail(url=image_url(data.poster_path, "poster", "thumbnail"))
     if data.first_air_date:
         embed.add_field(name="First Aired", value=format_date(data.first_air_date))
     if data.vote_average and data.vote_count:
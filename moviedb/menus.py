@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from contextlib import suppress
+from typing import Callable, Dict, Optional, Sequence
+
+import discord
+from redbot.core.commands import Context
+
+
+class PageSource:
+    """Menu pages which are only rendered when someone pages to them.
+
+    Takes one cheap callable per page. Rendered embeds are kept, so going back
+    and forth doesn't rebuild them, but pages nobody looks at are never built.
+    """
+
+    def __init__(self, renderers: Sequence[Callable[[], discord.Embed]]) -> None:
+        self.renderers = renderers
+        self._rendered: Dict[int, discord.Embed] = {}
+
+    def __len__(self) -> int:
+        return len(self.renderers)
+
+    def get_page(self, index: int) -> discord.Embed:
+        if index not in self._rendered:
+            self._rendered[index] = self.renderers[index]()
+        return self._rendered[index]
+
+
+class PageMenu(discord.ui.View):
+    """Button based paginator for a :class:`PageSource`."""
+
+    def __init__(self, source: PageSource, author_id: int, *, timeout: float = 120.0) -> None:
+        super().__init__(timeout=timeout)
+        self.source = source
+        self.author_id = author_id
+        self.current = 0
+        self.message: Optional[discord.Message] = None
+
+    async def start(self, ctx: Context) -> None:
+        if len(self.source) == 1:
+            self.stop()
+            await ctx.send(embed=self.source.get_page(0))
+            return
+        self.message = await ctx.send(embed=self.source.get_page(0), view=self)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                "You are not the author of this command.", ephemeral=True
+            )
+            return False
+        return True
+
+    async def on_timeout(self) -> None:
+        if self.message:
+            with suppress(discord.NotFound, discord.HTTPException):
+                await self.message.edit(view=None)
+
+    async def show_page(self, interaction: discord.Interaction, index: int) -> None:
+        self.current = index % len(self.source)
+        await interaction.response.edit_message(embed=self.source.get_page(self.current))
+
+    @discord.ui.button(emoji="\N{LEFTWARDS BLACK ARROW}", style=discord.ButtonStyle.grey)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, self.current - 1)
+
+    @discord.ui.button(emoji="\N{CROSS MARK}", style=discord.ButtonStyle.grey)
+    async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.stop()
+        await interaction.response.defer()
+        with suppress(discord.NotFound, discord.HTTPException):
+            await interaction.message.delete()
+
+    @discord.ui.button(emoji="\N{BLACK RIGHTWARDS ARROW}", style=discord.ButtonStyle.grey)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, self.current + 1)
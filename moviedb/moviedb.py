@@ -1,25 +1,42 @@
-from typing import Any, List, cast
+import asyncio
+import logging
+from functools import partial
+from typing import Dict, cast
 
 import aiohttp
 import discord
 from discord.app_commands import describe
-from redbot.core import commands
+from discord.ext import tasks
+from redbot.core import Config, commands
+from redbot.core.bot import Red
 from redbot.core.commands import Context
+from redbot.core.data_manager import cog_data_path
+from redbot.core.utils.chat_formatting import box
 from redbot.core.utils.menus import DEFAULT_CONTROLS, menu
 
-from .api.base import CDN_BASE, MediaNotFound
-from .api.details import MovieDetails, TVShowDetails
+from .api.base import SEARCH_CACHE, MediaNotFound
+from .api.client import LIMITER
+from .api.details import DETAILS_CACHE, MovieDetails, SeasonDetails, TVShowDetails
+from .api.images import load_image_config
 from .api.person import Person
-from .api.suggestions import MovieSuggestions, TVShowSuggestions
+from .api.trending import prewarm_trending
 from .converter import MovieFinder, PersonFinder, TVShowFinder
 from .embed_utils import (
+    cast_page_count,
+    make_cast_embed,
     make_movie_embed,
+    make_movie_production_embed,
     make_person_embed,
+    make_season_embed,
     make_suggestmovies_embed,
     make_suggestshows_embed,
     make_tvshow_embed,
-    parse_credits,
+    make_tvshow_production_embed,
 )
+from .menus import PageMenu, PageSource
+from .title_index import TitleIndex
+
+logger = logging.getLogger("red.owo.moviedb")
 
 
 class MovieDB(commands.Cog):
@@ -35,11 +52,63 @@ class MovieDB(commands.Cog):
             f"**Cog version:** {self.__version__}"
         )
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    def __init__(self, bot: Red) -> None:
+        self.bot = bot
+        self.api_key: str = ""
+        self.image_config_loaded: bool = False
         self.session = aiohttp.ClientSession()
+        self.title_index = TitleIndex(cog_data_path(self) / "tmdb_titles.sqlite3")
+        self.config = Config.get_conf(self, 357059159021060097, force_registration=True)
+        self.config.register_global(prewarm_enabled=False, prewarm_budget=20, prewarm_interval=6)
+        self._refresh_title_index.start()
+        self._prewarm_trending.start()
+
+    async def cog_load(self) -> None:
+        self.api_key = (await self.bot.get_shared_api_tokens("tmdb")).get("api_key", "")
+        asyncio.create_task(self._load_image_config())
+        delay: int = await self.config.prewarm_interval()
+        if delay != 6:
+            self._prewarm_trending.change_interval(hours=delay)
 
     async def cog_unload(self) -> None:
+        self._refresh_title_index.cancel()
+        self._prewarm_trending.cancel()
         await self.session.close()
+        await self.title_index.close()
+
+    @commands.Cog.listener()
+    async def on_red_api_tokens_update(self, service_name: str, api_tokens: Dict[str, str]) -> None:
+        if service_name == "tmdb":
+            self.api_key = api_tokens.get("api_key", "")
+            asyncio.create_task(self._load_image_config())
+
+    async def _load_image_config(self) -> None:
+        # image sizes barely ever change, so fetching them once per cog load is plenty
+        if self.api_key and not self.image_config_loaded:
+            self.image_config_loaded = await load_image_config(self.session, self.api_key)
+
+    @tasks.loop(hours=24)
+    async def _refresh_title_index(self) -> None:
+        # only keep it fresh once an owner has opted in by building it with [p]tmdbindex
+        if not self.title_index.ready:
+            return
+        try:
+            await self.title_index.update(self.session)
+        except Exception:
+            logger.exception("Failed to refresh the offline TMDB title index")
+
+    @tasks.loop(hours=6)
+    async def _prewarm_trending(self) -> None:
+        if not self.api_key or not await self.config.prewarm_enabled():
+            return
+        try:
+            await prewarm_trending(self.session, self.api_key, await self.config.prewarm_budget())
+        except Exception:
+            logger.exception("Failed to pre-warm TMDB caches with trending titles")
+
+    @_prewarm_trending.before_loop
+    async def _before_prewarm_trending(self) -> None:
+        await self.bot.wait_until_red_ready()
 
     async def red_delete_data_for_user(self, **kwargs) -> None:
         """Nothing to delete"""
@@ -52,6 +121,83 @@ class MovieDB(commands.Cog):
         my_perms = ctx.channel.permissions_for(ctx.guild.me)
         return my_perms.embed_links and my_perms.read_message_history
 
+    @commands.is_owner()
+    @commands.command(hidden=True)
+    async def tmdbstats(self, ctx: Context):
+        """Show TMDB search cache and client side rate limiter stats."""
+        sections = {
+            "Search cache": SEARCH_CACHE.stats,
+            "Details cache": DETAILS_CACHE.stats,
+            "Rate limiter": LIMITER.stats,
+        }
+        output = "\n\n".join(
+            f"# {title}\n" + "\n".join(
+                f"{key:<12}: {round(value, 3) if isinstance(value, float) else value}"
+                for key, value in stats.items()
+            )
+            for title, stats in sections.items()
+        )
+        await ctx.send(box(output, "py"))
+
+    @commands.is_owner()
+    @commands.command(hidden=True)
+    async def tmdbindex(self, ctx: Context):
+        """Build or refresh the offline title index used for slash command autocomplete.
+
+        This downloads TMDB's daily movie, TV show and person ID exports (the person
+        export alone is millions of lines) so the first run can take several minutes.
+        It's refreshed daily afterwards.
+        """
+        async with ctx.typing():
+            changes = await self.title_index.update(self.session)
+        if not changes:
+            return await ctx.send("Offline title index is already up to date (or exports are unavailable).")
+        await ctx.send(
+            "Offline title index updated: "
+            + ", ".join(f"{kind} ({count:,} changes)" for kind, count in changes.items())
+        )
+
+    @commands.is_owner()
+    @commands.group(hidden=True)
+    async def tmdbprewarm(self, ctx: Context):
+        """Pre-fetch today's trending movies and TV shows in the background.
+
+        Their details, credits and suggestions are then served from cache when
+        someone looks them up. Each title costs one TMDB request per run.
+        """
+        pass
+
+    @tmdbprewarm.command(name="toggle")
+    async def tmdbprewarm_toggle(self, ctx: Context):
+        """Enable or disable the trending pre-warmer. Disabled by default."""
+        enabled = not await self.config.prewarm_enabled()
+        await self.config.prewarm_enabled.set(enabled)
+        await ctx.send(f"✅ Trending pre-warmer is now {'enabled' if enabled else 'disabled'}.")
+        if enabled:
+            self._prewarm_trending.restart()
+
+    @tmdbprewarm.command(name="budget")
+    async def tmdbprewarm_budget(self, ctx: Context, titles: int):
+        """Set how many trending titles to pre-fetch per run.
+
+        Allowed budget is from 1 to 100 titles. Default is 20 titles.
+        """
+        budget = max(min(titles, 100), 1)
+        await self.config.prewarm_budget.set(budget)
+        await ctx.send(f"✅ Done. Up to {budget} trending titles will be pre-fetched per run.")
+
+    @tmdbprewarm.command(name="interval")
+    async def tmdbprewarm_interval(self, ctx: Context, hours: int):
+        """Specify the interval in hours between pre-warm runs.
+
+        Allowed interval is from 1 to 24 hours. Default is 6 hours, which is also
+        how long fetched details stay cached.
+        """
+        delay = max(min(hours, 24), 1)
+        self._prewarm_trending.change_interval(hours=delay)
+        await self.config.prewarm_interval.set(delay)
+        await ctx.send(f"✅ Done. Trending titles will be pre-fetched every {delay} hours.")
+
     @commands.bot_has_permissions(embed_links=True)
     @commands.hybrid_command(aliases=["actor", "director"])
     @describe(name="Type name of celebrity! i.e. actor, director, producer etc.")
@@ -68,7 +214,7 @@ class MovieDB(commands.Cog):
         if acting := data.combined_credits.cast:
             emb2 = discord.Embed(colour=emb1.colour)
             emb2.set_author(
-                name=f"{data.name}'s Acting Roles", icon_url=data.person_image, url=emb1.url
+                name=f"{data.name}'s Acting Roles", icon_url=data.person_icon, url=emb1.url
             )
             emb2.description = "\n".join(
                 f"`{cast.year}` • **{cast.title or cast.name}**"
@@ -84,7 +230,7 @@ class MovieDB(commands.Cog):
         if crew := data.combined_credits.crew:
             emb3 = discord.Embed(colour=emb1.colour)
             emb3.set_author(
-                name=f"{data.name}'s Production Roles", icon_url=data.person_image, url=emb1.url
+                name=f"{data.name}'s Production Roles", icon_url=data.person_icon, url=emb1.url
             )
             emb3.description = "\n".join(
                 f"`{crew.year or '????'}` • **{crew.title or crew.name}**"
@@ -112,35 +258,16 @@ class MovieDB(commands.Cog):
             return await ctx.send(str(movie))
 
         data = cast(MovieDetails, movie)
-        emb1 = make_movie_embed(data, await ctx.embed_colour())
-        emb2 = discord.Embed(colour=await ctx.embed_colour(), title=data.title)
-        emb2.url = f"https://www.themoviedb.org/movie/{data.id}"
-        emb2.set_image(url=f"{CDN_BASE}{data.backdrop_path or '/'}")
-        if data.production_companies:
-            emb2.add_field(name="Production Companies", value=data.all_production_companies)
-        if data.production_countries:
-            emb2.add_field(
-                name="Production Countries",
-                value=data.all_production_countries,
-                inline=False,
-            )
-        if data.tagline:
-            emb2.add_field(name="Tagline", value=data.tagline, inline=False)
-
-        celebrities = []
-        if data.credits:
-            emb2.set_footer(
-                text="See next page to see the celebrity cast!",
-                icon_url="https://i.imgur.com/sSE7Usn.png",
-            )
-            celebrities = parse_credits(
-                data.credits,
-                colour=await ctx.embed_colour(),
-                tmdb_id=f"movie/{data.id}",
-                title=data.title,
-            )
-
-        await menu(ctx, [emb1, emb2] + celebrities, DEFAULT_CONTROLS, timeout=120)
+        colour = await ctx.embed_colour()
+        renderers = [
+            partial(make_movie_embed, data, colour),
+            partial(make_movie_production_embed, data, colour),
+        ]
+        renderers += [
+            partial(make_cast_embed, data.credits, colour, data.title, f"movie/{data.id}", page)
+            for page in range(cast_page_count(data.credits))
+        ]
+        await PageMenu(PageSource(renderers), ctx.author.id).start(ctx)
 
     @commands.bot_has_permissions(embed_links=True)
     @commands.hybrid_command(aliases=["tv", "tvseries"], fallback='search')
@@ -154,38 +281,44 @@ class MovieDB(commands.Cog):
             return await ctx.send(str(tv_show))
 
         data = cast(TVShowDetails, tv_show)
-        emb1 = make_tvshow_embed(data, await ctx.embed_colour())
-        emb2 = discord.Embed(colour=await ctx.embed_colour(), title=data.name)
-        emb2.url = f"https://www.themoviedb.org/tv/{data.id}"
-        emb2.set_image(url=f"{CDN_BASE}{data.backdrop_path or '/'}")
-        if production_countries := data.production_countries:
-            emb2.add_field(
-                name="Production Countries",
-                value=", ".join([m.name for m in production_countries]),
-            )
-        if production_companies := data.production_companies:
-            emb2.add_field(
-                name="Production Companies",
-                value=", ".join([m.name for m in production_companies]),
-                inline=False,
-            )
-        if data.tagline:
-            emb2.add_field(name="Tagline", value=data.tagline, inline=False)
-
-        celebrities = []
-        if data.credits:
-            emb2.set_footer(
-                text="See next page to see this series' celebrity cast!",
-                icon_url="https://i.imgur.com/sSE7Usn.png",
-            )
-            celebrities = parse_credits(
-                data.credits,
-                colour=await ctx.embed_colour(),
-                tmdb_id=f"tv/{data.id}",
-                title=data.name,
-            )
+        colour = await ctx.embed_colour()
+        renderers = [
+            partial(make_tvshow_embed, data, colour),
+            partial(make_tvshow_production_embed, data, colour),
+        ]
+        renderers += [
+            partial(make_cast_embed, data.credits, colour, data.name, f"tv/{data.id}", page)
+            for page in range(cast_page_count(data.credits))
+        ]
+        await PageMenu(PageSource(renderers), ctx.author.id).start(ctx)
+
+    @commands.bot_has_permissions(embed_links=True)
+    @commands.hybrid_command(aliases=["tvepisodes"])
+    @describe(tv_show="Provide name of TV show. Try to be specific for accurate results!")
+    async def tvseasons(self, ctx: Context, *, tv_show: TVShowFinder):
+        """Browse episodes of a TV show/series, one season per page."""
+        await ctx.typing()
+        if not tv_show or isinstance(tv_show, MediaNotFound):
+            return await ctx.send(str(tv_show))
+
+        data = cast(TVShowDetails, tv_show)
+        if not data.seasons:
+            return await ctx.send("❌ That TV show doesn't have any seasons listed yet.")
+
+        seasons = await SeasonDetails.request(
+            self.session, self.api_key, data.id, [s.season_number for s in data.seasons]
+        )
+        if isinstance(seasons, MediaNotFound):
+            return await ctx.send(str(seasons))
+        if not seasons:
+            return await ctx.send("❌ Could not fetch episodes for that TV show.")
 
-        await menu(ctx, [emb1, emb2] + celebrities, DEFAULT_CONTROLS, timeout=120)
+        colour = await ctx.embed_colour()
+        renderers = [
+            partial(make_season_embed, data, season, colour, f"Page {i} of {len(seasons)}")
+            for i, season in enumerate(seasons, start=1)
+        ]
+        await PageMenu(PageSource(renderers), ctx.author.id).start(ctx)
 
     @commands.bot_has_permissions(embed_links=True)
     @commands.hybrid_command(aliases=['suggestmovie'])
@@ -198,14 +331,16 @@ class MovieDB(commands.Cog):
         if not movie or isinstance(movie, MediaNotFound):
             return await ctx.send(str(movie))
 
-        pages = []
-        output = cast(List[MovieSuggestions], movie)
-        for i, data in enumerate(output, start=1):
-            colour = await ctx.embed_colour()
-            footer = f"Page {i} of {len(output)}"
-            pages.append(make_suggestmovies_embed(data, colour, footer))
+        output = cast(MovieDetails, movie).suggestions
+        if not output:
+            return await ctx.send("❌ No recommendations found related to that movie.")
 
-        await menu(ctx, pages, DEFAULT_CONTROLS, timeout=120)
+        colour = await ctx.embed_colour()
+        renderers = [
+            partial(make_suggestmovies_embed, data, colour, f"Page {i} of {len(output)}")
+            for i, data in enumerate(output, start=1)
+        ]
+        await PageMenu(PageSource(renderers), ctx.author.id).start(ctx)
 
     @commands.bot_has_permissions(embed_links=True)
     @commands.hybrid_command(aliases=['suggestshow'])
@@ -218,11 +353,13 @@ class MovieDB(commands.Cog):
         if not tv_show or isinstance(tv_show, MediaNotFound):
             return await ctx.send(str(tv_show))
 
-        pages = []
-        output = cast(List[TVShowSuggestions], tv_show)
-        for i, data in enumerate(output, start=1):
-            colour = await ctx.embed_colour()
-            footer = f"Page {i} of {len(output)}"
-            pages.append(make_suggestshows_embed(data, colour, footer))
+        output = cast(TVShowDetails, tv_show).suggestions
+        if not output:
+            return await ctx.send("❌ No recommendations found related to that TV show.")
 
-        await menu(ctx, pages, DEFAULT_CONTROLS, timeout=120)
+        colour = await ctx.embed_colour()
+        renderers = [
+            partial(make_suggestshows_embed, data, colour, f"Page {i} of {len(output)}")
+            for i, data in enumerate(output, start=1)
+        ]
+        await PageMenu(PageSource(renderers), ctx.author.id).start(ctx)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+log = logging.getLogger("red.owo.moviedb.title_index")
+
+EXPORTS_BASE = "http://files.tmdb.org/p/exports"
+# kind -> (export file prefix, title key in each JSON line, code packed into rowid)
+EXPORTS = {
+    "movie": ("movie_ids", "original_title", 1),
+    "tv": ("tv_series_ids", "original_name", 2),
+    "person": ("person_ids", "name", 3),
+}
+BATCH_SIZE = 500
+COMMIT_EVERY = 50_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    rowid INTEGER PRIMARY KEY,
+    kind INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    popularity REAL NOT NULL DEFAULT 0,
+    stamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_kind_stamp ON entries (kind, stamp);
+CREATE TABLE IF NOT EXISTS exports (kind TEXT PRIMARY KEY, stamp TEXT NOT NULL);
+""" + "".join(
+    # one FTS table per kind, so a search only ranks titles of the kind it asked for
+    f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS titles_{kind} USING fts5(
+    name, content='entries', content_rowid='rowid', prefix='2 3 4'
+);"""
+    for kind in EXPORTS
+)
+
+
+class TitleIndex:
+    """Local full text index of TMDB's daily ID exports, used for offline autocomplete.
+
+    Rows are keyed by ``tmdb_id * 4 + kind code`` so movies, TV shows and people
+    can share one table, with an FTS table per kind over it. Ingestion streams
+    the gzip files line by line in batches, and only touches the FTS index for
+    titles that are new or renamed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        # searches run in the executor too, and may overlap while someone is typing
+        self._read_lock = threading.Lock()
+        # one update at a time, since they share the temporary download paths
+        self._update_lock = asyncio.Lock()
+        # tells an ingest running in the executor to stop early, so closing won't wait on it
+        self._closing = threading.Event()
+        self._writer = self._connect()
+        # a separate connection, so searches don't wait on a running ingest
+        self._reader = self._connect()
+        self.ready = {
+            kind for kind, in self._reader.execute("SELECT kind FROM exports").fetchall()
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    async def close(self) -> None:
+        self._closing.set()
+        await asyncio.get_running_loop().run_in_executor(None, self._close_connections)
+
+    def _close_connections(self) -> None:
+        with self._read_lock:
+            self._reader.close()
+        with self._lock:
+            self._writer.close()
+
+    async def search(self, kind: str, query: str, limit: int = 24) -> List[Tuple[int, str]]:
+        """Return ``(tmdb_id, title)`` pairs whose words start with the query's words."""
+        terms = re.findall(r"\w+", query.lower())
+        if kind not in self.ready or not terms or len(terms[-1]) < 2:
+            return []
+        # a lone two letter prefix matches a large share of millions of names
+        if len(terms) == 1 and len(terms[0]) < 3:
+            return []
+        match = " ".join(f'"{term}"' for term in terms[:-1]) + f' "{terms[-1]}"*'
+        rows = await asyncio.get_running_loop().run_in_executor(
+            None, self._search, kind, match.strip(), limit
+        )
+        return [(rowid >> 2, name) for rowid, name in rows]
+
+    def _search(self, kind: str, match: str, limit: int) -> List[Tuple[int, str]]:
+        with self._read_lock:
+            if self._closing.is_set():
+                return []
+            return self._reader.execute(
+                f"SELECT e.rowid, e.name FROM titles_{kind} f JOIN entries e ON e.rowid = f.rowid"
+                f" WHERE titles_{kind} MATCH ? ORDER BY e.popularity DESC LIMIT ?",
+                (match, limit),
+            ).fetchall()
+
+    async def update(self, session: aiohttp.ClientSession) -> Dict[str, int]:
+        """Download yesterday's exports and merge them in. Returns changed rows per kind."""
+        stamp = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%m_%d_%Y")
+        loop = asyncio.get_running_loop()
+        changes: Dict[str, int] = {}
+        async with self._update_lock:
+            for kind, (prefix, _, _) in EXPORTS.items():
+                if self._closing.is_set():
+                    break
+                if await loop.run_in_executor(None, self._stamp, kind) == stamp:
+                    continue
+                tmp_path = self.path.with_name(f"{prefix}_{stamp}.json.gz")
+                try:
+                    if not await self._download(session, f"{EXPORTS_BASE}/{prefix}_{stamp}.json.gz", tmp_path):
+                        continue
+                    changed = await loop.run_in_executor(None, self._ingest, kind, tmp_path, stamp)
+                    if changed is not None:
+                        changes[kind] = changed
+                        self.ready.add(kind)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+        return changes
+
+    def _stamp(self, kind: str) -> Optional[str]:
+        with self._read_lock:
+            row = self._reader.execute("SELECT stamp FROM exports WHERE kind = ?", (kind,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    async def _download(session: aiohttp.ClientSession, url: str, path: Path) -> bool:
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+        try:
+            async with session.get(url, timeout=timeout) as resp:
+                if resp.status != 200:
+                    log.info("TMDB export %s returned HTTP %s", url, resp.status)
+                    return False
+                with path.open("wb") as fp:
+                    async for chunk in resp.content.iter_chunked(1 << 16):
+                        fp.write(chunk)
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            log.exception("Failed to download TMDB export %s", url)
+            return False
+        return True
+
+    def _ingest(self, kind: str, path: Path, stamp: str) -> Optional[int]:
+        _, title_key, code = EXPORTS[kind]
+        changed = pending = 0
+        batch: List[Tuple[int, str, float]] = []
+        with self._lock, gzip.open(path, "rt", encoding="utf-8") as fp:
+            conn = self._writer
+            for line in fp:
+                if self._closing.is_set():
+                    # batches committed so far stay, but the export's stamp isn't
+                    # recorded, so the next update goes through the whole file again
+                    conn.rollback()
+                    return None
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                if row.get("adult") or not row.get(title_key):
+                    continue
+                batch.append((row["id"] * 4 + code, row[title_key], row.get("popularity") or 0.0))
+                if len(batch) >= BATCH_SIZE:
+                    changed += self._merge(conn, kind, code, batch, stamp)
+                    pending += len(batch)
+                    batch.clear()
+                    if pending >= COMMIT_EVERY:
+                        conn.commit()
+                        pending = 0
+            if batch:
+                changed += self._merge(conn, kind, code, batch, stamp)
+
+            stale = conn.execute(
+                "SELECT rowid, name FROM entries WHERE kind = ? AND stamp != ?", (code, stamp)
+            ).fetchall()
+            conn.executemany(
+                f"INSERT INTO titles_{kind}(titles_{kind}, rowid, name) VALUES('delete', ?, ?)", stale
+            )
+            conn.execute("DELETE FROM entries WHERE kind = ? AND stamp != ?", (code, stamp))
+            conn.execute("INSERT OR REPLACE INTO exports VALUES (?, ?)", (kind, stamp))
+            conn.commit()
+        log.info("TMDB %s index: %s new/renamed, %s removed", kind, changed, len(stale))
+        return changed + len(stale)
+
+    @staticmethod
+    def _merge(
+        conn: sqlite3.Connection,
+        kind: str,
+        code: int,
+        batch: Sequence[Tuple[int, str, float]],
+        stamp: str,
+    ) -> int:
+        existing = dict(
+            conn.execute(
+                f"SELECT rowid, name FROM entries WHERE rowid IN ({','.join('?' * len(batch))})",
+                [rowid for rowid, _, _ in batch],
+            ).fetchall()
+        )
+        same = [(pop, stamp, rowid) for rowid, name, pop in batch if existing.get(rowid) == name]
+        fresh = [(rowid, name, pop) for rowid, name, pop in batch if existing.get(rowid) != name]
+        conn.executemany("UPDATE entries SET popularity = ?, stamp = ? WHERE rowid = ?", same)
+        if not fresh:
+            return 0
+        conn.executemany(
+            f"INSERT INTO titles_{kind}(titles_{kind}, rowid, name) VALUES('delete', ?, ?)",
+            [(rowid, existing[rowid]) for rowid, _, _ in fresh if rowid in existing],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO entries (rowid, kind, name, popularity, stamp)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [(rowid, code, name, pop, stamp) for rowid, name, pop in fresh],
+        )
+        conn.executemany(
+            f"INSERT INTO titles_{kind} (rowid, name) VALUES (?, ?)",
+            [(rowid, name) for rowid, name, _ in fresh],
+        )
+        return len(fresh)
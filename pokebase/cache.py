@@ -0,0 +1,214 @@
+import json
+import sqlite3
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, body BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS aliases (url TEXT PRIMARY KEY, target TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS panels (poke_id INTEGER PRIMARY KEY, panel_id TEXT NOT NULL);
+"""
+# resources of the PokeAPI static dump (https://github.com/PokeAPI/api-data) the cog reads
+DUMP_RESOURCES = (
+    "ability",
+    "evolution-chain",
+    "item",
+    "item-category",
+    "item-fling-effect",
+    "location",
+    "location-area",
+    "move",
+    "pokemon",
+    "pokemon-species",
+)
+IMPORT_BATCH_SIZE = 500
+# cached responses are committed in batches of this many, or by flush()
+COMMIT_EVERY = 64
+
+
+class ResponseCache:
+    """Two tier cache for PokeAPI responses, which practically never change.
+
+    The hot tier is an in-memory LRU of raw JSON bytes, bounded by their total
+    size rather than by entry count, since payloads range from a few hundred
+    bytes to hundreds of KB. Everything is also written zlib compressed to a
+    SQLite file, so the cache survives cog reloads and bot restarts.
+    Disk writes are committed in batches, the owner should call :meth:`flush`
+    every few seconds so a quiet period doesn't leave them uncommitted.
+    Only successful responses should be stored.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.currsize = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._uncommitted = 0
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self.path = path
+        self._conn = self._connect()
+
+    def _connect(self, timeout: float = 5.0) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=timeout)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        return conn
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return url.rstrip("/")
+
+    def get(self, url: str) -> Optional[Any]:
+        key = self._key(url)
+        body = self._memory.get(key)
+        if body is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return json.loads(body)
+
+        # name lookups of imported dump entries are stored as aliases of their ID URL
+        row = self._conn.execute(
+            "SELECT body FROM responses"
+            " WHERE url = COALESCE((SELECT target FROM aliases WHERE url = ?), ?)",
+            (key, key),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        body = zlib.decompress(row[0])
+        self._remember(key, body)
+        return json.loads(body)
+
+    def set(self, url: str, body: bytes) -> None:
+        key = self._key(url)
+        self._remember(key, body)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?)", (key, zlib.compress(body, 6))
+        )
+        self._written()
+
+    def _written(self) -> None:
+        self._uncommitted += 1
+        if self._uncommitted >= COMMIT_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit responses written since the last commit."""
+        if self._uncommitted:
+            self._conn.commit()
+            self._uncommitted = 0
+
+    def _remember(self, key: str, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        if (old := self._memory.pop(key, None)) is not None:
+            self.currsize -= len(old)
+        self._memory[key] = body
+        self.currsize += len(body)
+        while self.currsize > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self.currsize -= len(evicted)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        self.currsize = 0
+        self._conn.execute("DELETE FROM responses")
+        self._conn.execute("DELETE FROM aliases")
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def get_panel(self, poke_id: int) -> Optional[str]:
+        """Pokecharms trainer card panel ID of a Pokémon, kept apart from API responses."""
+        row = self._conn.execute("SELECT panel_id FROM panels WHERE poke_id = ?", (poke_id,)).fetchone()
+        return row[0] if row else None
+
+    def set_panel(self, poke_id: int, panel_id: str) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO panels VALUES (?, ?)", (poke_id, panel_id))
+        self._written()
+
+    def import_dump(self, root: Path, api_url: str) -> Dict[str, int]:
+        """Load a local copy of PokeAPI's static dataset into the disk store.
+
+        ``root`` may point to the repository checkout or anywhere down to its
+        ``api/v2`` folder. Relative ``/api/v2/...`` links in the documents are
+        rewritten to ``api_url`` so they resolve from this store too.
+        This is blocking and is meant to be run in an executor.
+        Returns the number of documents imported per resource.
+        """
+        base = next(
+            (
+                path
+                for path in (root, root / "v2", root / "api" / "v2", root / "data" / "api" / "v2")
+                if (path / "pokemon").is_dir()
+            ),
+            None,
+        )
+        if base is None:
+            raise FileNotFoundError(f"No PokeAPI api/v2 data found under {root}")
+
+        counts: Dict[str, int] = {}
+        # may have to wait for a batch of cached responses to be committed
+        conn = self._connect(timeout=30.0)
+        try:
+            for resource in DUMP_RESOURCES:
+                if not (base / resource).is_dir():
+                    continue
+                rows: List[Tuple[str, bytes]] = []
+                aliases: List[Tuple[str, str]] = []
+                counts[resource] = 0
+                # the index.json directly in the resource folder is just the first list page
+                for file in (base / resource).glob("*/**/index.json"):
+                    relative = file.parent.relative_to(base).as_posix()
+                    text = file.read_text(encoding="utf-8").replace('"/api/v2/', f'"{api_url}/')
+                    url = f"{api_url}/{relative}"
+                    rows.append((url, zlib.compress(text.encode("utf-8"), 6)))
+                    if relative.count("/") == 1:
+                        name = json.loads(text).get("name")
+                        if name and name != file.parent.name:
+                            aliases.append((f"{api_url}/{resource}/{name}", url))
+                    if len(rows) >= IMPORT_BATCH_SIZE:
+                        counts[resource] += self._write_batch(conn, rows, aliases)
+                counts[resource] += self._write_batch(conn, rows, aliases)
+        finally:
+            conn.close()
+        return counts
+
+    @staticmethod
+    def _write_batch(
+        conn: sqlite3.Connection, rows: List[Tuple[str, bytes]], aliases: List[Tuple[str, str]]
+    ) -> int:
+        # short transactions, so responses cached meanwhile don't wait on the import
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?)", rows)
+            conn.executemany("INSERT OR REPLACE INTO aliases VALUES (?, ?)", aliases)
+        written = len(rows)
+        rows.clear()
+        aliases.clear()
+        return written
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        disk_entries, disk_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM responses"
+        ).fetchone()
+        total = self.hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self.currsize,
+            "max_bytes": self.max_bytes,
+            "disk_entries": disk_entries,
+            "disk_bytes": disk_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / total if total else 0.0,
+        }
@@ -0,0 +1,179 @@
+import operator
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .typechart import TYPE_INDEX, TYPES
+
+STATS = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+# query field -> column, with the short names people use for stats
+FIELDS = {
+    "hp": "hp",
+    "atk": "attack",
+    "attack": "attack",
+    "def": "defense",
+    "defense": "defense",
+    "spa": "special-attack",
+    "spatk": "special-attack",
+    "spd": "special-defense",
+    "spdef": "special-defense",
+    "spe": "speed",
+    "speed": "speed",
+    "total": "total",
+    "bst": "total",
+    "gen": "generation",
+    "generation": "generation",
+    "height": "height",
+    "weight": "weight",
+    "id": "id",
+}
+# heights and weights are queried and shown in metres and kilograms
+UNITS = {"height": (10, "m"), "weight": (10, "kg")}
+OPERATORS: Dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    "=": operator.eq,
+    ":": operator.eq,
+}
+_TERM = re.compile(r"^([a-z-]+)(>=|<=|!=|>|<|=|:)(.+)$")
+# most results a search returns, and the default when no limit is given
+DEFAULT_LIMIT = 100
+
+
+class QueryError(ValueError):
+    pass
+
+
+class DexStore:
+    """Base stats, types and sizes of every Pokémon species, one NumPy array per column.
+
+    Row ``i`` of every column describes the same species, so filters are boolean
+    masks combined across columns and sorting is a single argsort.
+    Heights are in decimetres and weights in hectograms, as PokeAPI returns them.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    @classmethod
+    def from_api(cls, pokemon: Sequence[Dict[str, Any]], generations: Dict[int, int]) -> "DexStore":
+        """Build from ``/pokemon/{id}`` responses of default forms and a species ID to generation map."""
+        pokemon = sorted(pokemon, key=lambda x: x["id"])
+        stats = {stat: np.zeros(len(pokemon), dtype=np.int16) for stat in STATS}
+        types = np.full((len(pokemon), 2), -1, dtype=np.int8)
+        for row, data in enumerate(pokemon):
+            for entry in data["stats"]:
+                if entry["stat"]["name"] in stats:
+                    stats[entry["stat"]["name"]][row] = entry["base_stat"]
+            for slot, entry in enumerate(data["types"][:2]):
+                types[row, slot] = TYPE_INDEX.get(entry["type"]["name"], -1)
+
+        columns = {
+            "id": np.array([x["id"] for x in pokemon], dtype=np.int16),
+            "name": np.array([x["name"] for x in pokemon]),
+            "type1": types[:, 0],
+            "type2": types[:, 1],
+            "generation": np.array([generations.get(x["id"], 0) for x in pokemon], dtype=np.int8),
+            "height": np.array([x["height"] for x in pokemon], dtype=np.int16),
+            "weight": np.array([x["weight"] for x in pokemon], dtype=np.int32),
+            **stats,
+        }
+        columns["total"] = np.sum([stats[stat] for stat in STATS], axis=0, dtype=np.int16)
+        return cls(columns)
+
+    def save(self, path: Path) -> None:
+        # written to a temporary file first, so a crash can't leave a truncated store
+        temp = path.with_suffix(".tmp.npz")
+        np.savez_compressed(temp, **self.columns)
+        temp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["DexStore"]:
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            return cls({key: data[key] for key in data.files})
+
+    def search(self, query: str) -> Tuple[np.ndarray, Optional[str]]:
+        """Row indices matching a query like ``type:fire speed>100 sort:total``, in order.
+
+        Returns the rows and the column they were sorted by, if any.
+        Raises :class:`QueryError` for anything that can't be parsed.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        sort_key: Optional[str] = None
+        descending = True
+        limit = DEFAULT_LIMIT
+
+        for term in query.lower().split():
+            match = _TERM.match(term)
+            if not match:
+                raise QueryError(f"Could not understand `{term}`.")
+            field, op, value = match.groups()
+            if field in ("sort", "limit") and op not in (":", "="):
+                raise QueryError(f"Could not understand `{term}`.")
+
+            if field == "type":
+                if value not in TYPE_INDEX:
+                    raise QueryError(f"`{value}` is not a Pokémon type.")
+                type_id = TYPE_INDEX[value]
+                has_type = (self.columns["type1"] == type_id) | (self.columns["type2"] == type_id)
+                if op in (":", "="):
+                    mask &= has_type
+                elif op == "!=":
+                    mask &= ~has_type
+                else:
+                    raise QueryError("Types can only be compared with `:` or `!=`.")
+            elif field == "sort":
+                value, _, direction = value.partition(":")
+                if value not in FIELDS:
+                    raise QueryError(f"Can not sort by `{value}`.")
+                sort_key = FIELDS[value]
+                descending = direction != "asc"
+            elif field == "limit":
+                if not value.isdigit() or not 0 < int(value) <= DEFAULT_LIMIT:
+                    raise QueryError(f"`limit` needs a whole number from 1 to {DEFAULT_LIMIT}.")
+                limit = int(value)
+            elif field in FIELDS:
+                try:
+                    number = float(value)
+                except ValueError:
+                    raise QueryError(f"`{term}` needs a number to compare {field} with.") from None
+                column = FIELDS[field]
+                scale = UNITS.get(column, (1, ""))[0]
+                mask &= OPERATORS[op](self.columns[column], number * scale)
+            else:
+                raise QueryError(f"Unknown field `{field}`.")
+
+        rows = np.flatnonzero(mask)
+        if sort_key:
+            values = self.columns[sort_key][rows]
+            # stable sort, so ties stay in National Pokédex order
+            order = np.argsort(-values.astype(np.int32) if descending else values, kind="stable")
+            rows = rows[order]
+        return rows[:limit], sort_key
+
+    def describe(self, row: int, sort_key: Optional[str] = None) -> str:
+        columns = self.columns
+        types = "/".join(
+            TYPES[t].title() for t in (columns["type1"][row], columns["type2"][row]) if t >= 0
+        )
+        name = str(columns["name"][row]).replace("-", " ").title()
+        line = f"`#{columns['id'][row]:>04}` **{name}** ({types}) • BST {columns['total'][row]}"
+        if sort_key and sort_key not in ("total", "id"):
+            scale, unit = UNITS.get(sort_key, (1, ""))
+            value = f"{columns[sort_key][row] / scale:g} {unit}".strip()
+            line += f" • {sort_key.replace('-', ' ').title()} {value}"
+        return line
+
+    def summary(self) -> List[str]:
+        counts = np.bincount(self.columns["generation"])
+        return [f"gen {gen}: {count}" for gen, count in enumerate(counts) if gen and count]
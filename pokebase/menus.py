@@ -0,0 +1,142 @@
+import asyncio
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+import discord
+from redbot.core.commands import Context
+
+# a fetcher returns the decoded API page, or the HTTP status code if it failed
+PageFetcher = Callable[[int], Awaitable[Union[Dict[str, Any], int]]]
+
+
+class CardSource:
+    """Pokémon TCG search results, requested from the API one page at a time.
+
+    An embed is only built when someone pages to its card, and the API page
+    after the one being viewed is fetched in the background ahead of time.
+    """
+
+    def __init__(
+        self, fetch: PageFetcher, first_page: Dict[str, Any], page_size: int, colour: discord.Colour
+    ) -> None:
+        self.fetch = fetch
+        self.page_size = page_size
+        self.colour = colour
+        self.total = first_page.get("totalCount", len(first_page["data"]))
+        self._pages: Dict[int, asyncio.Future] = {1: self._done(first_page)}
+        self._rendered: Dict[int, discord.Embed] = {}
+
+    @staticmethod
+    def _done(result: Any) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return future
+
+    def __len__(self) -> int:
+        return self.total
+
+    def _api_page(self, page: int) -> asyncio.Future:
+        if page not in self._pages:
+            self._pages[page] = asyncio.create_task(self.fetch(page))
+        return self._pages[page]
+
+    def is_ready(self, index: int) -> bool:
+        return index in self._rendered or self._api_page(index // self.page_size + 1).done()
+
+    def cancel(self) -> None:
+        for task in self._pages.values():
+            task.cancel()
+
+    async def get_page(self, index: int) -> discord.Embed:
+        if index in self._rendered:
+            return self._rendered[index]
+
+        api_page, offset = divmod(index, self.page_size)
+        future = self._api_page(api_page + 1)
+        data = await future
+        if type(data) is int and self._pages.get(api_page + 1) is future:
+            # forget failed pages, so paging back to them asks the API again
+            del self._pages[api_page + 1]
+        if (api_page + 1) * self.page_size < self.total:
+            self._api_page(api_page + 2)
+        if type(data) is int or offset >= len(data["data"]):
+            status = f"https://http.cat/{data}" if type(data) is int else "no card"
+            return discord.Embed(
+                colour=self.colour, description=f"⚠ Could not load this card. API sent {status}"
+            )
+
+        card = data["data"][offset]
+        embed = discord.Embed(colour=self.colour)
+        embed.title = card["name"]
+        embed.description = "**Rarity:** " + str(card.get("rarity"))
+        embed.add_field(name="Artist:", value=str(card.get("artist")))
+        embed.add_field(name="Belongs to Set:", value=str(card["set"]["name"]), inline=False)
+        embed.add_field(name="Set Release Date:", value=str(card["set"]["releaseDate"]))
+        embed.set_thumbnail(url=str(card["set"]["images"]["logo"]))
+        embed.set_image(url=str(card["images"]["large"]))
+        embed.set_footer(text=f"Page {index + 1} of {self.total} • Powered by Pokémon TCG API!")
+        self._rendered[index] = embed
+        return embed
+
+
+class CardMenu(discord.ui.View):
+    """Button based paginator for a :class:`CardSource`."""
+
+    def __init__(self, source: CardSource, author_id: int, *, timeout: float = 60.0) -> None:
+        super().__init__(timeout=timeout)
+        self.source = source
+        self.author_id = author_id
+        self.current = 0
+        self.message: Optional[discord.Message] = None
+
+    async def start(self, ctx: Context) -> None:
+        embed = await self.source.get_page(0)
+        if len(self.source) == 1:
+            self.stop()
+            await ctx.send(embed=embed)
+            return
+        self.message = await ctx.send(embed=embed, view=self)
+
+    def stop(self) -> None:
+        self.source.cancel()
+        super().stop()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                "You are not the author of this command.", ephemeral=True
+            )
+            return False
+        return True
+
+    async def on_timeout(self) -> None:
+        self.source.cancel()
+        if self.message:
+            with suppress(discord.NotFound, discord.HTTPException):
+                await self.message.edit(view=None)
+
+    async def show_page(self, interaction: discord.Interaction, index: int) -> None:
+        self.current = index % len(self.source)
+        if self.source.is_ready(self.current):
+            await interaction.response.edit_message(embed=await self.source.get_page(self.current))
+            return
+        # the API page isn't here yet, so acknowledge the click before waiting on it
+        await interaction.response.defer()
+        embed = await self.source.get_page(self.current)
+        with suppress(discord.NotFound, discord.HTTPException):
+            await interaction.edit_original_response(embed=embed)
+
+    @discord.ui.button(emoji="\N{LEFTWARDS BLACK ARROW}", style=discord.ButtonStyle.grey)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, self.current - 1)
+
+    @discord.ui.button(emoji="\N{CROSS MARK}", style=discord.ButtonStyle.grey)
+    async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.stop()
+        await interaction.response.defer()
+        with suppress(discord.NotFound, discord.HTTPException):
+            await interaction.message.delete()
+
+    @discord.ui.button(emoji="\N{BLACK RIGHTWARDS ARROW}", style=discord.ButtonStyle.grey)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, self.current + 1)
@@ -0,0 +1,149 @@
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Set
+
+# PokeAPI resources whose names users type into commands
+RESOURCES = ("pokemon", "pokemon-species", "move", "item", "ability", "item-category")
+
+
+def slugify(query: str) -> str:
+    """Turn user input like ``Mr. Mime`` or ``Farfetch'd`` into a PokeAPI slug."""
+    query = re.sub(r"[.'’:]", "", query.strip().lower())
+    return re.sub(r"[\s_,]+", "-", query).strip("-")
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, giving up with ``limit + 1`` as soon as it must exceed ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b))
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def bigrams(name: str) -> Set[str]:
+    padded = f"^{name}$"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class NameIndex:
+    """Sorted lists of every PokeAPI name per resource, for local typo correction.
+
+    Lookups try an exact match, then the shortest name starting with the query,
+    then the closest name within a small edit distance, all without a request.
+    Only names sharing enough bigrams with the query are measured for the last one.
+    """
+
+    def __init__(self) -> None:
+        self._names: Dict[str, List[str]] = {}
+        # resource -> bigram -> positions in _names of the names containing it
+        self._bigrams: Dict[str, Dict[str, List[int]]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._names)
+
+    def load(self, resource: str, names: Iterable[str]) -> None:
+        self._names[resource] = sorted(set(names))
+        postings: Dict[str, List[int]] = {}
+        for i, name in enumerate(self._names[resource]):
+            for gram in bigrams(name):
+                postings.setdefault(gram, []).append(i)
+        self._bigrams[resource] = postings
+
+    def _prefixed(self, resource: str, prefix: str) -> List[str]:
+        names = self._names.get(resource, [])
+        start = bisect_left(names, prefix)
+        end = bisect_left(names, prefix + "\uffff", start)
+        return names[start:end]
+
+    def _candidates(self, resource: str, slug: str, limit: int) -> List[str]:
+        """Names that could be within ``limit`` edits of ``slug``, in sorted order.
+
+        An edit changes at most two bigrams, so a name within ``limit`` edits
+        still shares all but ``2 * limit`` of the slug's bigrams.
+        """
+        names = self._names.get(resource, [])
+        grams = bigrams(slug)
+        needed = len(grams) - 2 * limit
+        if needed <= 0:
+            return names
+        postings = self._bigrams[resource]
+        shared = Counter(i for gram in grams for i in postings.get(gram, ()))
+        return [names[i] for i in sorted(shared) if shared[i] >= needed]
+
+    def resolve(self, query: str, *resources: str) -> str:
+        """Best known name for the query, or the slugified query if nothing is close enough.
+
+        Resources are tried in order, so ``("pokemon-species", "pokemon")`` prefers
+        ``pikachu`` over ``pikachu-rock-star`` for a query like ``pika``.
+        """
+        slug = slugify(query)
+        if not slug or slug.isdigit() or not any(r in self._names for r in resources):
+            return slug
+        for resource in resources:
+            names = self._names.get(resource, [])
+            if (i := bisect_left(names, slug)) < len(names) and names[i] == slug:
+                return slug
+        for resource in resources:
+            if prefixed := self._prefixed(resource, slug):
+                return min(prefixed, key=len)
+
+        limit = max(1, len(slug) // 4)
+        best, best_distance = slug, limit + 1
+        for resource in resources:
+            for name in self._candidates(resource, slug, limit):
+                distance = edit_distance(slug, name, min(limit, best_distance - 1))
+                if distance < best_distance:
+                    best, best_distance = name, distance
+            if best_distance == 1:
+                break
+        return best
+
+    def has(self, resource: str, name: str) -> bool:
+        names = self._names.get(resource, [])
+        i = bisect_left(names, name)
+        return i < len(names) and names[i] == name
+
+    def split(self, query: str, *resources: str, max_words: int = 3) -> List[str]:
+        """Split a list of names, keeping known multi-word names like ``tapu koko`` together.
+
+        Commas, if there are any, are taken as the only separators.
+        """
+        if "," in query:
+            return [part.strip() for part in query.split(",") if part.strip()]
+        words = query.split()
+        parts: List[str] = []
+        start = 0
+        while start < len(words):
+            # longest run of words that is a known name, else just the one word
+            end = next(
+                (
+                    end
+                    for end in range(min(start + max_words, len(words)), start + 1, -1)
+                    if any(self.has(r, slugify(" ".join(words[start:end]))) for r in resources)
+                ),
+                start + 1,
+            )
+            parts.append(" ".join(words[start:end]))
+            start = end
+        return parts
+
+    def complete(self, query: str, *resources: str, limit: int = 25) -> List[str]:
+        """Names for slash command autocomplete: prefix matches first, then substring matches."""
+        slug = slugify(query)
+        matches: List[str] = []
+        for resource in resources:
+            matches += sorted(self._prefixed(resource, slug), key=len)
+        if len(matches) < limit and slug:
+            for resource in resources:
+                matches += [name for name in self._names.get(resource, []) if slug in name[1:]]
+        return list(dict.fromkeys(matches))[:limit]
@@ -1,30 +1,61 @@
 import asyncio
 import base64
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from io import BytesIO
 from math import floor
+from pathlib import Path
 from random import choice, randint
 from string import capwords
-from typing import Any, Dict
+from typing import Any, Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 import aiohttp
 import discord
 import jmespath
-from aiocache import SimpleMemoryCache, cached
 from bs4 import BeautifulSoup as bsp
+from discord.ext import tasks
 from PIL import Image
 
 from redbot.core import commands
-from redbot.core.data_manager import bundled_data_path
-from redbot.core.utils.chat_formatting import bold, humanize_number, pagify
+from redbot.core.data_manager import bundled_data_path, cog_data_path
+from redbot.core.utils.chat_formatting import bold, box, humanize_number, pagify
 from redbot.core.utils.menus import DEFAULT_CONTROLS, menu
 
-from .utils import BADGES, STYLES, TRAINERS, Generation, get_generation
+from .cache import ResponseCache
+from .dex import DexStore, QueryError
+from .menus import CardMenu, CardSource
+from .names import RESOURCES, NameIndex
+from .typechart import TYPES, team_coverage, weakness_summary
+from .utils import BADGES, GEN_RANGES, STYLES, TRAINERS, Generation, get_generation
 
-cache = SimpleMemoryCache()
+log = logging.getLogger("red.owo.pokebase")
 
 API_URL = "https://pokeapi.co/api/v2"
 BULBAPEDIA_URL = "https://bulbapedia.bulbagarden.net/wiki"
+# prepared whosthatpokemon rounds kept per generation, each holds two ~1 MB PNGs
+ROUNDS_PER_POOL = 2
+PANEL_URL = "https://pokecharms.com/trainer-card-maker/pokemon-panels"
+# rendered trainer cards kept in memory, each PNG is around 100 KB
+TRAINER_CARDS_KEPT = 32
+TCG_API_URL = "https://api.pokemontcg.io/v2/cards"
+# cards per Pokémon TCG API request, and how long and how many of those pages are kept
+TCG_PAGE_SIZE = 10
+TCG_PAGE_TTL = 3600
+TCG_PAGES_KEPT = 128
+
+
+class Round(NamedTuple):
+    """Everything a whosthatpokemon game needs, prepared ahead of time."""
+
+    poke_id: int
+    hidden: bytes
+    revealed: bytes
+    eligible_names: List[str]
+    english_name: str
 
 
 class Pokebase(commands.Cog):
@@ -43,23 +74,86 @@ class Pokebase(commands.Cog):
 
     def __init__(self) -> None:
         self.session = aiohttp.ClientSession()
-
-    def cog_unload(self) -> None:
-        asyncio.create_task(self.session.close())
+        self.cache = ResponseCache(cog_data_path(self) / "pokeapi_cache.sqlite3")
+        self._template: Optional[Image.Image] = None
+        self._rounds: Dict[int, Deque[Round]] = {}
+        self._refills: Dict[int, asyncio.Task] = {}
+        # image composition and dex store files, shut down with the cog so no job outlives it
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pokebase")
+        self.names = NameIndex()
+        self._cards: "OrderedDict[Tuple[str, ...], bytes]" = OrderedDict()
+        self.dex: Optional[DexStore] = None
+        self._tcg_pages: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def cog_load(self) -> None:
+        self.dex = await asyncio.get_running_loop().run_in_executor(
+            self._executor, DexStore.load, cog_data_path(self) / "pokedex.npz"
+        )
+        self._refill_rounds(0)
+        self._refresh_names.start()
+        self._flush_cache.start()
+
+    async def cog_unload(self) -> None:
+        self._refresh_names.cancel()
+        self._flush_cache.cancel()
+        for task in self._refills.values():
+            task.cancel()
+        await asyncio.gather(*self._refills.values(), return_exceptions=True)
+        # waits for images still being composed, so nothing runs on after the cog is gone
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        await self.session.close()
+        self.cache.close()
 
     async def red_delete_data_for_user(self, **kwargs) -> None:
         """Nothing to delete."""
         return
 
-    @cached(ttl=86400, cache=SimpleMemoryCache)
-    async def get_data(self, url: str):
+    async def get_data(self, url: str, *, refresh: bool = False):
+        if not refresh and (cached_data := self.cache.get(url)) is not None:
+            return cached_data
         try:
             async with self.session.get(url) as response:
                 if response.status != 200:
                     return response.status
-                return await response.json()
+                body = await response.read()
         except asyncio.TimeoutError:
             return 408
+        # error status codes are returned as is and never cached
+        self.cache.set(url, body)
+        return json.loads(body)
+
+    @tasks.loop(seconds=2)
+    async def _flush_cache(self) -> None:
+        # responses are committed in batches, this makes sure none wait long on a quiet bot
+        self.cache.flush()
+
+    @tasks.loop(hours=168)
+    async def _refresh_names(self) -> None:
+        # the first run loads from cache, later ones pick up names added to PokeAPI since
+        refresh = self._refresh_names.current_loop > 0
+        results = await asyncio.gather(
+            *(
+                self.get_data(f"{API_URL}/{resource}?limit=100000", refresh=refresh)
+                for resource in RESOURCES
+            )
+        )
+        for resource, data in zip(RESOURCES, results):
+            if type(data) is int:
+                log.info("Could not load %s names from PokeAPI, HTTP %s", resource, data)
+                continue
+            self.names.load(resource, [x["name"] for x in data.get("results", [])])
+
+    async def gather_data(self, urls: Iterable[str], limit: int = 32) -> Dict[str, Any]:
+        """Fetch many URLs concurrently, at most ``limit`` at a time and each distinct URL once."""
+        unique_urls = list(dict.fromkeys(urls))
+        semaphore = asyncio.Semaphore(limit)
+
+        async def fetch(url: str):
+            async with semaphore:
+                return await self.get_data(url)
+
+        results = await asyncio.gather(*(fetch(url) for url in unique_urls))
+        return dict(zip(unique_urls, results))
 
     @staticmethod
     def basic_embed(colour: discord.Colour, data: Dict[str, Any]) -> discord.Embed:
@@ -174,6 +268,93 @@ class Pokebase(commands.Cog):
             )
         return f"{base_evo} {evolves_to}" if evolves_to else ""
 
+    @commands.is_owner()
+    @commands.group()
+    async def pokebaseset(self, ctx: commands.Context):
+        """Owner settings for Pokebase's local PokeAPI data."""
+        pass
+
+    @pokebaseset.command(name="import")
+    async def pokebaseset_import(self, ctx: commands.Context, *, path: str):
+        """Import PokeAPI's static dataset from a local path.
+
+        Clone or download https://github.com/PokeAPI/api-data and pass the path
+        of that folder. Pokémon, species, evolution chains, moves, items, abilities
+        and locations are then read locally, and PokeAPI is only queried for
+        anything missing from the dump.
+        """
+        root = Path(path.strip("\"'`")).expanduser()
+        started = time.perf_counter()
+        async with ctx.typing():
+            try:
+                counts = await asyncio.get_running_loop().run_in_executor(
+                    None, self.cache.import_dump, root, API_URL
+                )
+            except FileNotFoundError as exc:
+                return await ctx.send(f"⚠ {exc}")
+        summary = "\n".join(f"{resource:<18}: {count:,}" for resource, count in counts.items())
+        await ctx.send(
+            f"✅ Imported {sum(counts.values()):,} documents in {time.perf_counter() - started:.1f}s."
+            + box(summary, "yaml")
+        )
+
+    @pokebaseset.command(name="builddex")
+    async def pokebaseset_builddex(self, ctx: commands.Context):
+        """Build the local stats store used by `[p]pokedex search`.
+
+        This looks up every Pokémon species once, so it takes a while unless
+        the static dataset was imported first. Run it again after new Pokémon
+        are added to PokeAPI.
+        """
+        started = time.perf_counter()
+        async with ctx.typing():
+            generation_list = await self.get_data(f"{API_URL}/generation?limit=100")
+            if type(generation_list) is int:
+                return await ctx.send(f"⚠ API sent response code: https://http.cat/{generation_list}")
+            generations = await self.gather_data(x["url"] for x in generation_list["results"])
+
+            species_generation: Dict[int, int] = {}
+            for gen_data in generations.values():
+                if type(gen_data) is int:
+                    continue
+                for species in gen_data["pokemon_species"]:
+                    species_id = int(species["url"].rstrip("/").rsplit("/", 1)[-1])
+                    species_generation[species_id] = gen_data["id"]
+
+            # default forms share their ID with their species
+            results = await self.gather_data(
+                f"{API_URL}/pokemon/{species_id}" for species_id in sorted(species_generation)
+            )
+            pokemon = [data for data in results.values() if type(data) is not int]
+            if not pokemon:
+                return await ctx.send("⚠ Could not fetch any Pokémon from PokeAPI.")
+
+            dex = DexStore.from_api(pokemon, species_generation)
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, dex.save, cog_data_path(self) / "pokedex.npz"
+            )
+            self.dex = dex
+        missing = len(species_generation) - len(pokemon)
+        await ctx.send(
+            f"✅ Stored {len(dex):,} Pokémon in {time.perf_counter() - started:.1f}s."
+            + (f" {missing} could not be fetched." if missing else "")
+            + box("\n".join(dex.summary()), "yaml")
+        )
+
+    @pokebaseset.command(name="stats")
+    async def pokebaseset_stats(self, ctx: commands.Context):
+        """Show PokeAPI response cache stats."""
+        stats = self.cache.stats
+        await ctx.send(
+            box(
+                "\n".join(
+                    f"{key:<14}: {round(value, 3) if isinstance(value, float) else value}"
+                    for key, value in stats.items()
+                ),
+                "yaml",
+            )
+        )
+
     @commands.group(aliases=["pokemon"], invoke_without_command=True)
     @commands.bot_has_permissions(embed_links=True)
     @commands.cooldown(1, 5, commands.BucketType.member)
@@ -184,40 +365,162 @@ class Pokebase(commands.Cog):
 
         Pokémon ID refers to: [National Pokédex](https://bulbapedia.bulbagarden.net/wiki/National_Pok%C3%A9dex) number.
         """
-        pokemon = pokemon.replace(" ", "-")
+        pokemon = self.names.resolve(pokemon, "pokemon-species", "pokemon")
         async with ctx.typing():
-            data = await self.get_data(f'{API_URL}/pokemon/{pokemon.lower()}')
+            started = time.perf_counter()
+            # default forms share their name with the species, so both requests go out together
+            data, species_data = await asyncio.gather(
+                self.get_data(f"{API_URL}/pokemon/{pokemon}"),
+                self.get_data(f"{API_URL}/pokemon-species/{pokemon}"),
+            )
+            if type(data) is int and type(species_data) is not int:
+                # species names like "deoxys" only exist as a pokemon named "deoxys-normal"
+                default = [x for x in species_data.get("varieties", []) if x.get("is_default")]
+                if default:
+                    data = await self.get_data(default[0]["pokemon"]["url"])
             if type(data) is int:
                 if data == 404:
                     return await ctx.send("⚠ Could not find any Pokémon with that name.")
                 return await ctx.send(f"⚠ API sent response code: https://http.cat/{data}")
+            fetched = time.perf_counter()
+
+            if type(species_data) is int and data.get("species"):
+                # alternate forms (e.g. "charizard-mega-x") belong to a differently named species
+                species_data = await self.get_data(data["species"]["url"])
+            species_fetched = time.perf_counter()
+
+            if_evolves = ""
+            if type(species_data) is not int and species_data.get("evolution_chain"):
+                if_evolves = await self.evolution_chain(species_data["evolution_chain"]["url"])
+            evolution_fetched = time.perf_counter()
 
             embed = self.basic_embed(await ctx.embed_colour(), data)
             embed.set_footer(text="Powered by Poke API")
             pokemon_name = data.get("name", "none").title()
-            species_data = await self.get_data(f'{API_URL}/pokemon-species/{data.get("id")}')
-
             if type(species_data) is not int:
                 with suppress(IndexError):
                     pokemon_name = [x["name"] for x in species_data["names"] if x["language"]["name"] == "en"][0]
                 embed = self.species_embed(embed, species_data)
             embed = self.base_stats_embed(embed, data)
-            if species_data and species_data.get("evolution_chain"):
-                evo_url = species_data["evolution_chain"].get("url")
-                if_evolves = await self.evolution_chain(evo_url)
-                if if_evolves:
-                    embed.add_field(name="Evolution Chain", value=if_evolves, inline=False)
+            if if_evolves:
+                embed.add_field(name="Evolution Chain", value=if_evolves, inline=False)
 
             type_effect_url = (
                 f"{BULBAPEDIA_URL}/{pokemon_name.replace(' ', '_')}_%28Pokémon%29#Type_effectiveness"
             )
-            embed.add_field(name="Weakness/Resistance", value=f"[See it on Bulbapedia]({type_effect_url})")
+            weaknesses = weakness_summary([x["type"]["name"] for x in data.get("types", [])])
+            embed.add_field(
+                name="Weakness/Resistance",
+                value=f"{weaknesses}\n[See it on Bulbapedia]({type_effect_url})",
+                inline=False,
+            )
             embed.set_author(
                 name=f"#{data['id']:>03} - {pokemon_name}",
                 url=f"https://www.pokemon.com/us/pokedex/{data.get('name')}",
             )
+            log.debug(
+                "pokedex %s: pokemon+species %.1fms, species fallback %.1fms,"
+                " evolution chain %.1fms, embed %.1fms",
+                pokemon,
+                (fetched - started) * 1000,
+                (species_fetched - fetched) * 1000,
+                (evolution_fetched - species_fetched) * 1000,
+                (time.perf_counter() - evolution_fetched) * 1000,
+            )
         await ctx.send(embed=embed)
 
+    @pokedex.command()
+    async def team(self, ctx: commands.Context, *, pokemons: str):
+        """Analyse type coverage of a team of up to 6 Pokémon.
+
+        For every type, it shows how many team members are weak to it, how many
+        resist (or are immune to) it, and how many have a same type attack that
+        is super effective against it.
+
+        Separate names with spaces or commas. Known multi-word names such as
+        `tapu koko` are kept together; use commas if one is split wrongly.
+        """
+        pokemons = self.names.split(pokemons, "pokemon-species", "pokemon")
+        if not pokemons or len(pokemons) > 6:
+            return await ctx.send("Provide between 1 and 6 Pokémon names or IDs.")
+
+        async with ctx.typing():
+            urls = [f"{API_URL}/pokemon/{self.names.resolve(name, 'pokemon')}" for name in pokemons]
+            results = await self.gather_data(urls)
+            not_found = [name for name, url in zip(pokemons, urls) if type(results[url]) is int]
+            if not_found:
+                return await ctx.send(f"⚠ Could not find these Pokémon: {', '.join(not_found)}")
+
+            team_data = [results[url] for url in dict.fromkeys(urls)]
+            coverage = team_coverage(
+                [[x["type"]["name"] for x in member.get("types", [])] for member in team_data]
+            )
+            table = f"{'Type':<10} Weak  Resist  Hits SE\n" + "\n".join(
+                f"{name.title():<10} {coverage['weak'][i]:>4}  {coverage['resist'][i]:>6}"
+                f"  {coverage['super_effective'][i]:>7}"
+                for i, name in enumerate(TYPES)
+            )
+            threats = [
+                TYPES[i].title() for i in range(len(TYPES))
+                if coverage["weak"][i] > coverage["resist"][i]
+            ]
+            uncovered = [
+                TYPES[i].title() for i in range(len(TYPES)) if not coverage["super_effective"][i]
+            ]
+
+            embed = discord.Embed(colour=await ctx.embed_colour())
+            embed.title = "Team: " + ", ".join(member["name"].title() for member in team_data)
+            embed.description = box(table, "prolog")
+            embed.add_field(name="Threats", value=", ".join(threats) or "None", inline=False)
+            embed.add_field(
+                name="Not hit super effectively", value=", ".join(uncovered) or "None", inline=False
+            )
+            embed.set_footer(text="Powered by Poke API")
+        await ctx.send(embed=embed)
+
+    @pokedex.command()
+    async def search(self, ctx: commands.Context, *, query: str):
+        """Find Pokémon by type, generation, base stats, height or weight.
+
+        Combine any number of filters, separated by spaces:
+        ```apache
+        type:fire  type!=flying      either type matches, or neither does
+        speed>100  total>=600  gen<=4
+        hp atk def spa spd spe total gen height weight id
+        sort:speed       highest first, sort:speed:asc for lowest first
+        limit:20         1 to 100, 100 results by default
+        ```
+        Heights are in metres and weights in kilograms.
+
+        **Example:**
+        - `[p]pokedex search type:fire speed>100 sort:total`
+        """
+        if self.dex is None:
+            return await ctx.send(
+                "⚠ The local Pokédex store isn't built yet."
+                " The bot owner can build it with `pokebaseset builddex`."
+            )
+        started = time.perf_counter()
+        try:
+            rows, sort_key = self.dex.search(query)
+        except QueryError as exc:
+            return await ctx.send(f"⚠ {exc} See `{ctx.clean_prefix}help pokedex search`.")
+        elapsed = (time.perf_counter() - started) * 1e6
+        if not len(rows):
+            return await ctx.send("No Pokémon match all of those filters.")
+
+        results = "\n".join(self.dex.describe(row, sort_key) for row in rows)
+        pages = []
+        all_pages = list(pagify(results, page_length=1000))
+        for i, page in enumerate(all_pages, start=1):
+            embed = discord.Embed(colour=await ctx.embed_colour(), description=page)
+            embed.title = f"{len(rows)} Pokémon found"
+            embed.set_footer(text=f"Page {i} of {len(all_pages)} • searched in {elapsed:.0f} µs")
+            pages.append(embed)
+        if len(pages) == 1:
+            return await ctx.send(embed=pages[0])
+        await menu(ctx, pages, DEFAULT_CONTROLS, timeout=60.0)
+
     @pokedex.command()
     async def ability(self, ctx: commands.Context, *, ability: str):
         """Get various info about a known Pokémon ability.
@@ -232,7 +535,7 @@ class Pokebase(commands.Cog):
         • https://bulbapedia.bulbagarden.net/wiki/Ability#List_of_Abilities
         """
         async with ctx.typing():
-            data = await self.get_data(f'{API_URL}/ability/{ability.replace(" ", "-").lower()}')
+            data = await self.get_data(f'{API_URL}/ability/{self.names.resolve(ability, "ability")}')
             if type(data) is int:
                 if data == 404:
                     return await ctx.send("⚠ Could not find Pokémon abilities with that name.")
@@ -270,9 +573,9 @@ class Pokebase(commands.Cog):
     @pokedex.command()
     async def moves(self, ctx: commands.Context, pokemon: str):
         """Get the Pokémon's moves set."""
-        pokemon = pokemon.replace(" ", "-")
+        pokemon = self.names.resolve(pokemon, "pokemon")
         async with ctx.typing():
-            data = await self.get_data(f'{API_URL}/pokemon/{pokemon.lower()}')
+            data = await self.get_data(f'{API_URL}/pokemon/{pokemon}')
             if type(data) is int:
                 if data == 404:
                     return await ctx.send("⚠ Could not find Pokémon moves.")
@@ -314,7 +617,7 @@ class Pokebase(commands.Cog):
         You can find a list of known Pokémon moves here:
         https://bulbapedia.bulbagarden.net/wiki/List_of_moves
         """
-        move_query = move.replace(",", " ").replace(" ", "-").replace("'", "").lower()
+        move_query = self.names.resolve(move, "move")
         async with ctx.typing():
             data = await self.get_data(f'{API_URL}/move/{move_query}/')
             if type(data) is int:
@@ -388,7 +691,7 @@ class Pokebase(commands.Cog):
         • https://bulbapedia.bulbagarden.net/wiki/Item
         • https://bulbapedia.bulbagarden.net/wiki/Category:Items
         """
-        item = item.replace(" ", "-").lower()
+        item = self.names.resolve(item, "item")
         async with ctx.typing():
             embed = discord.Embed(colour=await ctx.embed_colour())
             item_data = await self.get_data(f'{API_URL}/item/{item}')
@@ -444,7 +747,7 @@ class Pokebase(commands.Cog):
     @commands.bot_has_permissions(embed_links=True)
     async def item_category(self, ctx: commands.Context, *, category: str):
         """Fetch items in a given Pokémon item category."""
-        category = category.replace(" ", "-").lower()
+        category = self.names.resolve(category, "item-category")
         async with ctx.typing():
             category_data = await self.get_data(f'{API_URL}/item-category/{category}/')
             if type(category_data) is int:
@@ -466,9 +769,9 @@ class Pokebase(commands.Cog):
     @pokedex.command()
     async def location(self, ctx: commands.Context, pokemon: str):
         """Responds with the location data for a Pokémon."""
-        pokemon = pokemon.replace(" ", "-")
+        pokemon = self.names.resolve(pokemon, "pokemon")
         async with ctx.typing():
-            data = await self.get_data(f'{API_URL}/pokemon/{pokemon.lower()}')
+            data = await self.get_data(f'{API_URL}/pokemon/{pokemon}')
             if type(data) is int:
                 if data == 404:
                     return await ctx.send("⚠ Could not find a location with that name.")
@@ -483,12 +786,18 @@ class Pokebase(commands.Cog):
             jquery = jmespath.compile("[*].{url: location_area.url, name: version_details[*].version.name}")
             new_dict = jquery.search(get_encounters)
 
+            # many areas belong to the same location, so both hops are deduped
+            areas = await self.gather_data(loc["url"] for loc in new_dict)
+            locations = await self.gather_data(
+                area["location"]["url"] for area in areas.values() if type(area) is not int
+            )
+
             pretty_data = ""
             for i, loc in enumerate(new_dict, 1):
-                area_data = await self.get_data(loc["url"])
+                area_data = areas[loc["url"]]
                 if type(area_data) is int:
                     continue
-                location_data = await self.get_data(area_data["location"]["url"])
+                location_data = locations[area_data["location"]["url"]]
                 if type(location_data) is int:
                     continue
                 location_names = ", ".join(x["name"] for x in location_data["names"] if x["language"]["name"] == "en")
@@ -510,42 +819,73 @@ class Pokebase(commands.Cog):
         """Fetch Pokémon cards based on Pokémon Trading Card Game (a.k.a Pokémon TCG)."""
         api_key = (await ctx.bot.get_shared_api_tokens("pokemontcg")).get("api_key")
         headers = {"X-Api-Key": api_key} if api_key else None
-        async with ctx.typing():
-            base_url = f"https://api.pokemontcg.io/v2/cards?q=name:{query}"
-            try:
-                async with self.session.get(base_url, headers=headers) as response:
-                    if response.status != 200:
-                        await ctx.send(f"https://http.cat/{response.status}")
-                        return
-                    output = await response.json()
-            except asyncio.TimeoutError:
-                return await ctx.send("Operation timed out.")
+        query = query.strip().lower()
 
+        async def fetch(page: int):
+            return await self.fetch_tcg_page(query, page, headers)
+
+        async with ctx.typing():
+            output = await fetch(1)
+            if type(output) is int:
+                if output == 408:
+                    return await ctx.send("Operation timed out.")
+                return await ctx.send(f"https://http.cat/{output}")
             if not output["data"]:
                 return await ctx.send("No results.")
 
-            pages = []
-            for i, data in enumerate(output["data"], 1):
-                embed = discord.Embed(colour=await ctx.embed_colour())
-                embed.title = data["name"]
-                embed.description = "**Rarity:** " + str(data.get("rarity"))
-                embed.add_field(name="Artist:", value=str(data.get("artist")))
-                embed.add_field(name="Belongs to Set:", value=str(data["set"]["name"]), inline=False)
-                embed.add_field(name="Set Release Date:", value=str(data["set"]["releaseDate"]))
-                embed.set_thumbnail(url=str(data["set"]["images"]["logo"]))
-                embed.set_image(url=str(data["images"]["large"]))
-                embed.set_footer(
-                    text=f"Page {i} of {len(output['data'])} • Powered by Pokémon TCG API!"
-                )
-                pages.append(embed)
-
-        if len(pages) == 1:
-            return await ctx.send(embed=pages[0])
-
-        await menu(ctx, pages, DEFAULT_CONTROLS, timeout=60.0)
+            source = CardSource(fetch, output, TCG_PAGE_SIZE, await ctx.embed_colour())
+            await CardMenu(source, ctx.author.id).start(ctx)
+
+    async def fetch_tcg_page(
+        self, query: str, page: int, headers: Optional[Dict[str, str]]
+    ) -> Union[Dict[str, Any], int]:
+        """One page of Pokémon TCG API card search results, kept for a while per query."""
+        key = (query, page)
+        if (cached_page := self._tcg_pages.get(key)) is not None:
+            fetched_at, data = cached_page
+            if time.monotonic() - fetched_at < TCG_PAGE_TTL:
+                self._tcg_pages.move_to_end(key)
+                return data
+            del self._tcg_pages[key]
+
+        params = {"q": f"name:{query}", "page": page, "pageSize": TCG_PAGE_SIZE}
+        try:
+            async with self.session.get(TCG_API_URL, params=params, headers=headers) as response:
+                if response.status != 200:
+                    return response.status
+                data = await response.json()
+        except asyncio.TimeoutError:
+            return 408
+        except aiohttp.ClientError:
+            return 503
+
+        self._tcg_pages[key] = (time.monotonic(), data)
+        if len(self._tcg_pages) > TCG_PAGES_KEPT:
+            self._tcg_pages.popitem(last=False)
+        return data
+
+    async def fetch_panel_id(self, poke_id: int) -> str:
+        """Pokecharms panel ID of a Pokémon, which never changes once looked up."""
+        if (panel_id := self.cache.get_panel(poke_id)) is not None:
+            return panel_id
+
+        payload = aiohttp.FormData()
+        payload.add_field("number", str(poke_id))
+        payload.add_field("_xfResponseType", "json")
+        try:
+            async with self.session.post(PANEL_URL, data=payload) as resp:
+                if resp.status != 200:
+                    return "1"
+                soup = bsp((await resp.json()).get("templateHtml") or "", "html.parser")
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
+            return "1"
+        panel = soup.find("li")
+        if panel is None or not panel.get("data-id"):
+            return "1"
+        self.cache.set_panel(poke_id, panel["data-id"])
+        return panel["data-id"]
 
     @commands.command()
-    @cached(ttl=86400, cache=SimpleMemoryCache)
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
     @commands.cooldown(1, 60, commands.BucketType.guild)
     async def trainercard(
@@ -567,46 +907,38 @@ class Pokebase(commands.Cog):
         ℹ Pokémons from #891 to #898 are not supported yet for trainer card
         """
         base_url = "https://pokecharms.com/index.php?trainer-card-maker/render"
-        if style.lower() not in ["default", "black", "collector", "dp", "purple"]:
+        style, trainer, badge = style.lower(), trainer.lower(), badge.lower()
+        if style not in ["default", "black", "collector", "dp", "purple"]:
             return await ctx.send(f"style value `{style}` is unsupported. See command help!")
-        if trainer.lower() not in ["ash", "red", "ethan", "lyra", "brendan", "may", "lucas", "dawn"]:
+        if trainer not in ["ash", "red", "ethan", "lyra", "brendan", "may", "lucas", "dawn"]:
             return await ctx.send(f"trainer value `{trainer}` is unsupported. See command help!")
-        if badge.lower() not in ["kanto", "johto", "hoenn", "sinnoh", "unova", "kalos"]:
+        if badge not in ["kanto", "johto", "hoenn", "sinnoh", "unova", "kalos"]:
             return await ctx.send(f"badge value `{badge}` is unsupported. See command help!")
         if len(pokemons.split()) > 6:
             return await ctx.send("You cannot provide more than 6 Pokémons.")
 
+        slugs = [self.names.resolve(pokemon, "pokemon") for pokemon in pokemons.split()]
+        card_key = (name[:12], style, trainer, badge, *slugs)
+        if (card := self._cards.get(card_key)) is not None:
+            self._cards.move_to_end(card_key)
+            return await ctx.send(file=discord.File(BytesIO(card), "trainer-card.png"))
+
         async with ctx.typing():
-            pkmn_ids = []
-            for pokemon in pokemons.split():
-                get_ids = await self.get_data(f'{API_URL}/pokemon/{pokemon.lower()}')
-                if type(get_ids) is int:
-                    continue
-                if get_ids.get("id"):
-                    pkmn_ids.append(get_ids["id"])
-
-            panel_ids = []
-            panel_url = "https://pokecharms.com/trainer-card-maker/pokemon-panels"
-            for npn in pkmn_ids:
-                payload = aiohttp.FormData()
-                payload.add_field("number", npn)
-                payload.add_field("_xfResponseType", "json")
-                async with self.session.post(panel_url, data=payload) as resp:
-                    if resp.status != 200:
-                        panel_ids.append("1")
-                    soup = bsp((await resp.json()).get("templateHtml"), "html.parser")
-                    try:
-                        panel_ids.append(soup.find_all("li")[0].get("data-id"))
-                    except IndexError:
-                        panel_ids.append("1")
+            urls = [f"{API_URL}/pokemon/{slug}" for slug in slugs]
+            results = await self.gather_data(urls)
+            pkmn_ids = [
+                results[url]["id"] for url in urls
+                if type(results[url]) is not int and results[url].get("id")
+            ]
+            panel_ids = await asyncio.gather(*(self.fetch_panel_id(npn) for npn in pkmn_ids))
 
             form = aiohttp.FormData()
             form.add_field("trainername", name[:12])
-            form.add_field("background", str(STYLES[style.lower()]))
-            form.add_field("character", str(TRAINERS[trainer.lower()]))
+            form.add_field("background", str(STYLES[style]))
+            form.add_field("character", str(TRAINERS[trainer]))
             form.add_field("badges", "8")
-            form.add_field("badgesUsed", ",".join(str(x) for x in BADGES[badge.lower()]))
-            form.add_field("pokemon", str(len(pokemons.split())))
+            form.add_field("badgesUsed", ",".join(str(x) for x in BADGES[badge]))
+            form.add_field("pokemon", str(len(panel_ids)))
             form.add_field("pokemonUsed", ",".join(panel_ids))
             form.add_field("_xfResponseType", "json")
             try:
@@ -618,51 +950,114 @@ class Pokebase(commands.Cog):
                 return await ctx.send("Operation timed out.")
 
         if output:
-            base64_img_bytes = output.encode("utf-8")
-            decoded_image_data = BytesIO(base64.decodebytes(base64_img_bytes))
-            decoded_image_data.seek(0)
-            await ctx.send(file=discord.File(decoded_image_data, "trainer-card.png"))
+            card = base64.decodebytes(output.encode("utf-8"))
+            self._cards[card_key] = card
+            if len(self._cards) > TRAINER_CARDS_KEPT:
+                self._cards.popitem(last=False)
+            await ctx.send(file=discord.File(BytesIO(card), "trainer-card.png"))
             return
         else:
             await ctx.send("No trainer card was generated. :(")
 
-    async def generate_image(self, poke_id, hide: bool):
-        base_image = Image.open(bundled_data_path(self) / "template.webp").convert("RGBA")
-        bg_width, bg_height = base_image.size
-        base_url = f"https://assets.pokemon.com/assets/cms2/img/pokedex/full/{poke_id}.png"
+    async def fetch_sprite(self, poke_id: int) -> Optional[bytes]:
+        base_url = f"https://assets.pokemon.com/assets/cms2/img/pokedex/full/{poke_id:>03}.png"
         try:
             async with self.session.get(base_url) as response:
                 if response.status != 200:
                     return None
-                data = await response.read()
-        except asyncio.TimeoutError:
+                return await response.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError):
             return None
 
-        pbytes = BytesIO(data)
-        poke_image = Image.open(pbytes)
-        poke_width, poke_height = poke_image.size
-        poke_image_resized = poke_image.resize((int(poke_width * 1.6), int(poke_height * 1.6)))
+    async def prepare_round(self, generation: int) -> Optional[Round]:
+        """Build a whosthatpokemon round from one sprite download and one species lookup."""
+        poke_id = randint(*GEN_RANGES[generation])
+        sprite, species_data = await asyncio.gather(
+            self.fetch_sprite(poke_id), self.get_data(f"{API_URL}/pokemon-species/{poke_id}")
+        )
+        if sprite is None or type(species_data) is int:
+            return None
+        names_data = species_data.get("names", [{}])
+        english_name = [x["name"] for x in names_data if x["language"]["name"] == "en"]
+        if not english_name:
+            return None
 
+        loop = asyncio.get_running_loop()
+        hidden, revealed = await loop.run_in_executor(self._executor, self._compose_pair, sprite)
+        return Round(
+            poke_id, hidden, revealed, [x["name"].lower() for x in names_data], english_name[0]
+        )
+
+    def _compose_pair(self, sprite: bytes) -> Tuple[bytes, bytes]:
+        return (
+            self._compose_image(sprite, True).getvalue(),
+            self._compose_image(sprite, False).getvalue(),
+        )
+
+    def _refill_rounds(self, generation: int) -> None:
+        task = self._refills.get(generation)
+        if task is None or task.done():
+            task = asyncio.create_task(self._fill_pool(generation))
+            task.add_done_callback(self._log_refill_error)
+            self._refills[generation] = task
+
+    @staticmethod
+    def _log_refill_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            log.error("whosthatpokemon pool refill stopped", exc_info=exc)
+
+    async def _fill_pool(self, generation: int) -> None:
+        pool = self._rounds.setdefault(generation, deque())
+        failures = 0
+        while len(pool) < ROUNDS_PER_POOL and failures < 3:
+            try:
+                game = await self.prepare_round(generation)
+            except Exception:
+                # a bad sprite or a dropped connection shouldn't stop the pool from refilling
+                log.exception("Failed to prepare a whosthatpokemon round for gen %s", generation)
+                game = None
+            if game is None:
+                failures += 1
+                continue
+            pool.append(game)
+
+    async def take_round(self, generation: int) -> Optional[Round]:
+        """A prepared round if one is ready, else one built right now. Either way the pool refills."""
+        pool = self._rounds.get(generation)
+        game = pool.popleft() if pool else await self.prepare_round(generation)
+        self._refill_rounds(generation)
+        return game
+
+    def _compose_image(self, sprite: bytes, hide: bool) -> BytesIO:
+        """Paste the sprite, or its silhouette, on the template. CPU bound, run it in an executor."""
+        if self._template is None:
+            with Image.open(bundled_data_path(self) / "template.webp") as template:
+                # the template is opaque, an RGB canvas encodes faster and smaller
+                self._template = template.convert("RGB")
+        base_image = self._template.copy()
+        bg_width, bg_height = base_image.size
+
+        with Image.open(BytesIO(sprite)) as poke_image:
+            poke_width, poke_height = poke_image.size
+            poke_image_resized = poke_image.convert("RGBA").resize(
+                (int(poke_width * 1.6), int(poke_height * 1.6))
+            )
+
+        mask = poke_image_resized
         if hide:
-            p_load = poke_image_resized.load()
-            for y in range(poke_image_resized.size[1]):
-                for x in range(poke_image_resized.size[0]):
-                    if p_load[x, y] == (0, 0, 0, 0):  # type: ignore
-                        continue
-                    else:
-                        p_load[x, y] = (1, 1, 1)  # type: ignore
+            # every pixel that isn't fully transparent becomes solid (1, 1, 1)
+            mask = poke_image_resized.getchannel("A").point(lambda a: 255 if a else 0)
+            poke_image_resized = Image.new("RGB", mask.size, (1, 1, 1))
 
         paste_w = int((bg_width - poke_width) / 10)
         paste_h = int((bg_height - poke_height) / 4)
 
-        base_image.paste(poke_image_resized, (paste_w, paste_h), poke_image_resized)
+        base_image.paste(poke_image_resized, (paste_w, paste_h), mask)
 
         temp = BytesIO()
         base_image.save(temp, "png")
         temp.seek(0)
-        pbytes.close()
         base_image.close()
-        poke_image.close()
         return temp
 
     @staticmethod
@@ -684,30 +1079,23 @@ class Pokebase(commands.Cog):
         Otherwise, it will default to pulling random pokemon from all 8 Gens.
         """
         async with ctx.typing():
-            poke_id = generation or randint(1, 898)
             if_guessed_right = False
-
-            temp = await self.generate_image(f"{poke_id:>03}", True)
-            if temp is None:
+            game = await self.take_round(generation or 0)
+            if game is None:
                 return await ctx.send("Failed to generate whosthatpokemon card image.")
 
             inital_img = await ctx.send(
                 "You have **30 seconds** to answer. Who's that Pokémon?",
-                file=discord.File(temp, "guessthatpokemon.png"),
+                file=discord.File(BytesIO(game.hidden), "guessthatpokemon.png"),
             )
             message = await ctx.send("You have **3**/3 attempts left to guess it right.")
-            species_data = await self.get_data(f"{API_URL}/pokemon-species/{poke_id}")
-            if type(species_data) is int:
-                return await ctx.send("Failed to get species data from PokeAPI.")
-            names_data = species_data.get("names", [{}])
-            eligible_names = [x["name"].lower() for x in names_data]
-            english_name = [x["name"] for x in names_data if x["language"]["name"] == "en"][0]
+            eligible_names = game.eligible_names
+            english_name = game.english_name
 
             def check(msg: discord.Message) -> bool:
                 return msg.author.id == ctx.author.id and msg.channel.id == ctx.channel.id
 
-            revealed = await self.generate_image(f"{poke_id:>03}", False)
-            revealed_img = discord.File(revealed, "whosthatpokemon.png")
+            revealed_img = discord.File(BytesIO(game.revealed), "whosthatpokemon.png")
 
         attempts = 0
         while attempts != 3:
@@ -0,0 +1,92 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+TYPES = [
+    "normal", "fire", "water", "electric", "grass", "ice", "fighting", "poison", "ground",
+    "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark", "steel", "fairy",
+]
+TYPE_INDEX = {name: i for i, name in enumerate(TYPES)}
+
+# attacking type -> (super effective against, not very effective against, no effect on)
+_MATCHUPS: Dict[str, Tuple[str, str, str]] = {
+    "normal": ("", "rock steel", "ghost"),
+    "fire": ("grass ice bug steel", "fire water rock dragon", ""),
+    "water": ("fire ground rock", "water grass dragon", ""),
+    "electric": ("water flying", "electric grass dragon", "ground"),
+    "grass": ("water ground rock", "fire grass poison flying bug dragon steel", ""),
+    "ice": ("grass ground flying dragon", "fire water ice steel", ""),
+    "fighting": ("normal ice rock dark steel", "poison flying psychic bug fairy", "ghost"),
+    "poison": ("grass fairy", "poison ground rock ghost", "steel"),
+    "ground": ("fire electric poison rock steel", "grass bug", "flying"),
+    "flying": ("grass fighting bug", "electric rock steel", ""),
+    "psychic": ("fighting poison", "psychic steel", "dark"),
+    "bug": ("grass psychic dark", "fire fighting poison flying ghost steel fairy", ""),
+    "rock": ("fire ice flying bug", "fighting ground steel", ""),
+    "ghost": ("psychic ghost", "dark", "normal"),
+    "dragon": ("dragon", "steel", "fairy"),
+    "dark": ("psychic ghost", "fighting dark fairy", ""),
+    "steel": ("ice rock fairy", "fire water electric steel", ""),
+    "fairy": ("fighting dragon dark", "fire poison steel", ""),
+}
+
+
+def _build_chart() -> np.ndarray:
+    chart = np.ones((len(TYPES), len(TYPES)))
+    for attacker, matchups in _MATCHUPS.items():
+        for multiplier, defenders in zip((2.0, 0.5, 0.0), matchups):
+            for defender in defenders.split():
+                chart[TYPE_INDEX[attacker], TYPE_INDEX[defender]] = multiplier
+    return chart
+
+
+# CHART[attacking type, defending type] -> damage multiplier (Gen 6 onwards)
+CHART = _build_chart()
+CHART.flags.writeable = False
+# multipliers of dual types multiply, so they add up in log space; immunities are tracked apart
+_IMMUNE = (CHART == 0).astype(np.int8)
+_LOG_CHART = np.log2(np.where(CHART == 0, 1.0, CHART))
+_SUPER_EFFECTIVE = (CHART > 1).astype(np.int8)
+
+
+def type_matrix(teams: Sequence[Sequence[str]]) -> np.ndarray:
+    """One row per Pokémon with a 1 in the column of each of its types."""
+    matrix = np.zeros((len(teams), len(TYPES)), dtype=np.int8)
+    for row, types in enumerate(teams):
+        for name in types:
+            if name in TYPE_INDEX:
+                matrix[row, TYPE_INDEX[name]] = 1
+    return matrix
+
+
+def defensive_multipliers(types_matrix: np.ndarray) -> np.ndarray:
+    """Damage taken by each Pokémon (rows) from each attacking type (columns)."""
+    log_damage = types_matrix @ _LOG_CHART.T
+    immune = (types_matrix @ _IMMUNE.T) > 0
+    return np.where(immune, 0.0, np.exp2(log_damage))
+
+
+def weakness_summary(types: Sequence[str]) -> str:
+    """Human readable weaknesses and resistances of a single or dual type Pokémon."""
+    damage = defensive_multipliers(type_matrix([types]))[0]
+    labels = [(4.0, "4x"), (2.0, "2x"), (0.5, "½x"), (0.25, "¼x"), (0.0, "0x")]
+    lines: List[str] = []
+    for multiplier, label in labels:
+        matching = [TYPES[i].title() for i in np.flatnonzero(damage == multiplier)]
+        if matching:
+            lines.append(f"**{label}:** {', '.join(matching)}")
+    return "\n".join(lines)
+
+
+def team_coverage(types: Sequence[Sequence[str]]) -> Dict[str, np.ndarray]:
+    """Per type counts of team members weak to, resisting, and hitting it super effectively.
+
+    Computed for the whole team at once with matrix products over its type matrix.
+    """
+    matrix = type_matrix(types)
+    damage = defensive_multipliers(matrix)
+    return {
+        "weak": (damage > 1).sum(axis=0),
+        "resist": (damage < 1).sum(axis=0),
+        "super_effective": ((matrix @ _SUPER_EFFECTIVE) > 0).sum(axis=0),
+    }
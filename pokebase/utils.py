@@ -1,5 +1,3 @@
-import random
-
 from redbot.core import commands
 
 BADGES = {
@@ -23,6 +21,18 @@ GENERATIONS = {
     "ss": "Sword/Shield\n(Gen. 8)",
 }
 GEN_KEYS = list(GENERATIONS.keys())
+# National Pokédex ID range per generation, 0 stands for all supported generations
+GEN_RANGES = {
+    0: (1, 898),
+    1: (1, 151),
+    2: (152, 251),
+    3: (252, 386),
+    4: (387, 493),
+    5: (494, 649),
+    6: (650, 721),
+    7: (722, 809),
+    8: (810, 898),
+}
 
 STYLES = {"default": 3, "black": 50, "collector": 96, "dp": 5, "purple": 43}
 TRAINERS = {
@@ -61,6 +71,7 @@ def get_generation(pokemon_id: int) -> str:
 
 
 class Generation(commands.Converter):
+    """Converts ``gen1`` to ``gen8`` to the generation number."""
 
     async def convert(self, ctx: commands.Context, argument: str) -> int:
         allowed_gens = [f"gen{x}" for x in range(1, 9)]
@@ -68,21 +79,4 @@ class Generation(commands.Converter):
             ctx.command.reset_cooldown(ctx)
             raise commands.BadArgument("Only `gen1` to `gen8` values are allowed.")
 
-        if argument == "gen1":
-            return random.randint(1, 151)
-        elif argument == "gen2":
-            return random.randint(152, 251)
-        elif argument == "gen3":
-            return random.randint(252, 386)
-        elif argument == "gen4":
-            return random.randint(387, 493)
-        elif argument == "gen5":
-            return random.randint(494, 649)
-        elif argument == "gen6":
-            return random.randint(650, 721)
-        elif argument == "gen7":
-            return random.randint(722, 809)
-        elif argument == "gen8":
-            return random.randint(810, 898)
-        else:
-            return random.randint(1, 898)
\ No newline at end of file
+        return int(argument[3:])
@@ -1,6 +1,11 @@
+import asyncio
+import logging
+from collections import Counter
 from random import choice
+from typing import Dict, Optional, Tuple
 
 import discord
+from discord.ext import tasks
 from redbot.core import Config, commands
 from redbot.core.bot import Red
 from redbot.core.commands import Context
@@ -11,6 +16,12 @@ from tabulate import tabulate
 
 from .constants import *
 
+log = logging.getLogger("red.owo.roleplay")
+
+# (guild ID, user ID, field) of a member counter, or (None, user ID, field) of a global one
+CounterKey = Tuple[Optional[int], int, str]
+FLUSH_INTERVAL = 60
+
 
 class Roleplay(commands.Cog):
     """Do roleplay with your Discord friends or virtual strangers."""
@@ -88,10 +99,68 @@ class Roleplay(commands.Cog):
         self.config.register_global(**default_global)
         self.config.register_member(**default_user)
         self.config.register_user(**default_user)
+        # counter increments not yet saved to Config, and the member counts shown in footers
+        self._pending: "Counter[CounterKey]" = Counter()
+        self._counts: Dict[CounterKey, int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_counters.start()
         # TODO: you can do better
         if self.bot.get_cog("General"):
             self.bot.remove_command("hug")
 
+    async def cog_unload(self):
+        self._flush_counters.cancel()
+        # saved here rather than in after_loop, which could run after Config is torn down
+        await self.flush_counters()
+
+    async def _bump(self, member: discord.Member, field: str) -> int:
+        """Count one more ``field`` for the member, here and globally, without touching Config.
+
+        Returns the member's count in this server, which is what footers show.
+        """
+        key = (member.guild.id, member.id, field)
+        if key not in self._counts:
+            saved = await self.config.member_from_ids(*key[:2]).get_attr(field)()
+            # another action may have loaded it while this one waited on Config
+            self._counts.setdefault(key, saved)
+        self._counts[key] += 1
+        self._pending[key] += 1
+        self._pending[(None, member.id, field)] += 1
+        return self._counts[key]
+
+    async def _record(
+        self, action: str, author: discord.Member, member: discord.Member
+    ) -> Tuple[int, int]:
+        """Count an action sent by ``author`` to ``member``, returning both their new counts."""
+        sent = await self._bump(author, f"{action}_SENT")
+        received = await self._bump(member, f"{action}_RECEIVED")
+        return sent, received
+
+    async def flush_counters(self) -> None:
+        """Save buffered counter increments to Config, one write per changed counter."""
+        async with self._flush_lock:
+            pending, self._pending = self._pending, Counter()
+            for (guild_id, user_id, field), delta in pending.items():
+                if guild_id is None:
+                    group = self.config.user_from_id(user_id)
+                else:
+                    group = self.config.member_from_ids(guild_id, user_id)
+                value = group.get_attr(field)
+                try:
+                    await value.set(await value() + delta)
+                except Exception:
+                    log.exception("Could not save roleplay counter %s, retrying later", field)
+                    self._pending[(guild_id, user_id, field)] += delta
+            # saved counts are read back from Config when next needed, so memory stays flat
+            for key in pending:
+                if key not in self._pending:
+                    self._counts.pop(key, None)
+
+    @tasks.loop(seconds=FLUSH_INTERVAL)
+    async def _flush_counters(self):
+        # shielded, so cancelling the loop can't drop increments that are half written
+        await asyncio.shield(self.flush_counters())
+
     @staticmethod
     async def temp_tip(ctx: commands.Context):
         pre = ctx.clean_prefix
@@ -112,20 +181,13 @@ class Roleplay(commands.Cog):
             return await ctx.send(f"{bold(ctx.author.name)}, you really are BAKA. Stupid!! 💩")
 
         async with ctx.typing():
-            baka_to = await self.config.member(ctx.author).BAKAS_SENT()
-            baka_from = await self.config.member(member).BAKAS_RECEIVED()
-            gbaka_to = await self.config.user(ctx.author).BAKAS_SENT()
-            gbaka_from = await self.config.user(member).BAKAS_RECEIVED()
-            await self.config.member(ctx.author).BAKAS_SENT.set(baka_to + 1)
-            await self.config.member(member).BAKAS_RECEIVED.set(baka_from + 1)
-            await self.config.user(ctx.author).BAKAS_SENT.set(gbaka_to + 1)
-            await self.config.user(member).BAKAS_RECEIVED.set(gbaka_from + 1)
+            baka_to, baka_from = await self._record("BAKAS", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             message = f"_**{ctx.author.name}** calls {member.mention} a BAKA bahahahahaha!!!_"
             embed.set_image(url=choice(BAKA))
             footer = (
-                f"{ctx.author.name} used baka: {baka_to + 1} times so far.\n"
-                f"{member.name} got called a BAKA: {baka_from + 1} times  so far."
+                f"{ctx.author.name} used baka: {baka_to} times so far.\n"
+                f"{member.name} got called a BAKA: {baka_from} times  so far."
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -143,39 +205,30 @@ class Roleplay(commands.Cog):
                 f"{ctx.author.mention} Self bullying doesn't make sense. Stop it, get some help."
             )
         async with ctx.typing():
-            bully_to = await self.config.member(ctx.author).BULLY_SENT()
-            bully_from = await self.config.member(member).BULLY_RECEIVED()
-            gbully_to = await self.config.user(ctx.author).BULLY_SENT()
-            gbully_from = await self.config.user(member).BULLY_RECEIVED()
-            await self.config.member(ctx.author).BULLY_SENT.set(bully_to + 1)
-            await self.config.member(member).BULLY_RECEIVED.set(bully_from + 1)
-            await self.config.user(ctx.author).BULLY_SENT.set(gbully_to + 1)
-            await self.config.user(member).BULLY_RECEIVED.set(gbully_from + 1)
+            bully_to, bully_from = await self._record("BULLY", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             message = f"_**{ctx.author.name}** bullies {member.mention}_ 🤡"
             embed.set_image(url=choice(BULLY))
             footer = (
-                f"{ctx.author.name} bullied: {bully_to + 1} times so far.\n"
-                f"{member.name} got bullied: {bully_from + 1} times so far.\n"
+                f"{ctx.author.name} bullied: {bully_to} times so far.\n"
+                f"{member.name} got bullied: {bully_from} times so far.\n"
                 f"Someone call police to get {ctx.author.name} arrested."
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
 
     @commands.command()
+    @commands.guild_only()
     @commands.bot_has_permissions(embed_links=True)
     @commands.cooldown(1, 10, commands.BucketType.member)
     async def cry(self, ctx: Context):
         """Let others know that you feel like crying or just wanna cry."""
         async with ctx.typing():
-            cry_count = await self.config.member(ctx.author).CRY_COUNT()
-            gcry_count = await self.config.user(ctx.author).CRY_COUNT()
-            await self.config.member(ctx.author).CRY_COUNT.set(cry_count + 1)
-            await self.config.user(ctx.author).CRY_COUNT.set(gcry_count + 1)
+            cry_count = await self._bump(ctx.author, "CRY_COUNT")
             embed = discord.Embed(colour=ctx.author.colour)
             embed.description = f"{ctx.author.mention} {choice(CRY_STRINGS)}"
             embed.set_image(url=choice(CRY))
-            footer = f"{ctx.author.name} has cried {cry_count + 1} times in this server so far."
+            footer = f"{ctx.author.name} has cried {cry_count} times in this server so far."
             embed.set_footer(text=footer)
             return await ctx.send(embed=embed)
 
@@ -193,14 +246,7 @@ class Roleplay(commands.Cog):
             )
 
         async with ctx.typing():
-            cuddle_to = await self.config.member(ctx.author).CUDDLES_SENT()
-            cuddle_from = await self.config.member(member).CUDDLES_RECEIVED()
-            gcuddle_to = await self.config.user(ctx.author).CUDDLES_SENT()
-            gcuddle_from = await self.config.user(member).CUDDLES_RECEIVED()
-            await self.config.member(ctx.author).CUDDLES_SENT.set(cuddle_to + 1)
-            await self.config.member(member).CUDDLES_RECEIVED.set(cuddle_from + 1)
-            await self.config.user(ctx.author).CUDDLES_SENT.set(gcuddle_to + 1)
-            await self.config.user(member).CUDDLES_RECEIVED.set(gcuddle_from + 1)
+            cuddle_to, cuddle_from = await self._record("CUDDLES", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             if member.id == ctx.me.id:
                 message = f"Awww thanks for cuddles, {bold(ctx.author.name)}! Very kind of you. 😳"
@@ -208,9 +254,9 @@ class Roleplay(commands.Cog):
                 message = f"_**{ctx.author.name}** cuddles_ {member.mention}"
             embed.set_image(url=str(choice(CUDDLE)))
             footer = (
-                f"{ctx.author.name} sent: {cuddle_to + 1} cuddles so far.\n"
+                f"{ctx.author.name} sent: {cuddle_to} cuddles so far.\n"
                 f"{'I' if member.id == ctx.me.id else member.name} "
-                f"received: {cuddle_from + 1} cuddles so far."
+                f"received: {cuddle_from} cuddles so far."
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -225,14 +271,7 @@ class Roleplay(commands.Cog):
             return await ctx.send(f"_{ctx.author.mention} eats {bold(choice(RECIPES))}!_")
 
         async with ctx.typing():
-            feed_to = await self.config.member(ctx.author).FEEDS_SENT()
-            feed_from = await self.config.member(member).FEEDS_RECEIVED()
-            gfeed_to = await self.config.user(ctx.author).FEEDS_SENT()
-            gfeed_from = await self.config.user(member).FEEDS_RECEIVED()
-            await self.config.member(ctx.author).FEEDS_SENT.set(feed_to + 1)
-            await self.config.member(member).FEEDS_RECEIVED.set(feed_from + 1)
-            await self.config.user(ctx.author).FEEDS_SENT.set(gfeed_to + 1)
-            await self.config.user(member).FEEDS_RECEIVED.set(gfeed_from + 1)
+            feed_to, feed_from = await self._record("FEEDS", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             if member.id == ctx.me.id:
                 message = f"OWO! Thanks for yummy food..., {bold(ctx.author.name)}! ❤️"
@@ -240,9 +279,9 @@ class Roleplay(commands.Cog):
                 message = f"_**{ctx.author.name}** feeds {member.mention} some delicious food!_"
             embed.set_image(url=choice(FEED))
             footer = (
-                f"{ctx.author.name} have fed others: {feed_to + 1} times so far.\n"
+                f"{ctx.author.name} have fed others: {feed_to} times so far.\n"
                 f"{'I' if member.id == ctx.me.id else member.name} "
-                f"received some food: {feed_from + 1} times so far."
+                f"received some food: {feed_from} times so far."
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -259,14 +298,7 @@ class Roleplay(commands.Cog):
             )
 
         async with ctx.typing():
-            h5_to = await self.config.member(ctx.author).HIGHFIVES_SENT()
-            h5_from = await self.config.member(member).HIGHFIVES_RECEIVED()
-            gh5_to = await self.config.user(ctx.author).HIGHFIVES_SENT()
-            gh5_from = await self.config.user(member).HIGHFIVES_RECEIVED()
-            await self.config.member(ctx.author).HIGHFIVES_SENT.set(h5_to + 1)
-            await self.config.member(member).HIGHFIVES_RECEIVED.set(h5_from + 1)
-            await self.config.user(ctx.author).HIGHFIVES_SENT.set(gh5_to + 1)
-            await self.config.user(member).HIGHFIVES_RECEIVED.set(gh5_from + 1)
+            h5_to, h5_from = await self._record("HIGHFIVES", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             if member.id == ctx.me.id:
                 message = f"_high-fives back to {bold(ctx.author.name)}_ 👀"
@@ -275,9 +307,9 @@ class Roleplay(commands.Cog):
                 message = f"_**{ctx.author.name}** high fives_ {member.mention}"
                 embed.set_image(url=choice(HIGHFIVE))
             footer = (
-                f"{ctx.author.name} sent: {h5_to + 1} high-fives so far.\n"
+                f"{ctx.author.name} sent: {h5_to} high-fives so far.\n"
                 f"{'I' if member.id == ctx.me.id else member.name} "
-                f"received: {h5_from + 1} high-fives so far."
+                f"received: {h5_from} high-fives so far."
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -294,14 +326,7 @@ class Roleplay(commands.Cog):
             )
 
         async with ctx.typing():
-            hug_to = await self.config.member(ctx.author).HUGS_SENT()
-            hug_from = await self.config.member(member).HUGS_RECEIVED()
-            ghug_to = await self.config.user(ctx.author).HUGS_SENT()
-            ghug_from = await self.config.user(member).HUGS_RECEIVED()
-            await self.config.member(ctx.author).HUGS_SENT.set(hug_to + 1)
-            await self.config.member(member).HUGS_RECEIVED.set(hug_from + 1)
-            await self.config.user(ctx.author).HUGS_SENT.set(ghug_to + 1)
-            await self.config.user(member).HUGS_RECEIVED.set(ghug_from + 1)
+            hug_to, hug_from = await self._record("HUGS", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             if member.id == ctx.me.id:
                 message = f"Awwww thanks! So nice of you! _hugs **{ctx.author.name}** back_ 🤗"
@@ -309,9 +334,9 @@ class Roleplay(commands.Cog):
                 message = f"_**{ctx.author.name}** hugs_ {member.mention} 🤗"
             embed.set_image(url=str(choice(HUG)))
             footer = (
-                f"{ctx.author.name} gave: {hug_to + 1} hugs so far.\n"
+                f"{ctx.author.name} gave: {hug_to} hugs so far.\n"
                 f"{'I' if member.id == ctx.me.id else member.name} "
-                f"received: {hug_from + 1} hugs so far!"
+                f"received: {hug_from} hugs so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -328,20 +353,13 @@ class Roleplay(commands.Cog):
             return await ctx.send(f"{ctx.author.mention} Seppukku is not allowed on my watch. 💀")
 
         async with ctx.typing():
-            kill_to = await self.config.member(ctx.author).KILLS_SENT()
-            kill_from = await self.config.member(member).KILLS_RECEIVED()
-            gkill_to = await self.config.user(ctx.author).KILLS_SENT()
-            gkill_from = await self.config.user(member).KILLS_RECEIVED()
-            await self.config.member(ctx.author).KILLS_SENT.set(kill_to + 1)
-            await self.config.member(member).KILLS_RECEIVED.set(kill_from + 1)
-            await self.config.user(ctx.author).KILLS_SENT.set(gkill_to + 1)
-            await self.config.user(member).KILLS_RECEIVED.set(gkill_from + 1)
+            kill_to, kill_from = await self._record("KILLS", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             message = f"_**{ctx.author.name}** tries to kill {member.mention}!_ 🇫"
             embed.set_image(url=choice(KILL))
             footer = (
-                f"{ctx.author.name} attempted: {kill_to + 1} kills so far.\n"
-                f"{member.name} got killed: {kill_from + 1} times so far!"
+                f"{ctx.author.name} attempted: {kill_to} kills so far.\n"
+                f"{member.name} got killed: {kill_from} times so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -357,14 +375,7 @@ class Roleplay(commands.Cog):
                 f"Poggers {bold(ctx.author.name)}, you just kissed yourself! LOL!!! 💋"
             )
         async with ctx.typing():
-            kiss_to = await self.config.member(ctx.author).KISSES_SENT()
-            kiss_from = await self.config.member(member).KISSES_RECEIVED()
-            gkiss_to = await self.config.user(ctx.author).KISSES_SENT()
-            gkiss_from = await self.config.user(member).KISSES_RECEIVED()
-            await self.config.member(ctx.author).KISSES_SENT.set(kiss_to + 1)
-            await self.config.member(member).KISSES_RECEIVED.set(kiss_from + 1)
-            await self.config.user(ctx.author).KISSES_SENT.set(gkiss_to + 1)
-            await self.config.user(member).KISSES_RECEIVED.set(gkiss_from + 1)
+            kiss_to, kiss_from = await self._record("KISSES", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             if member.id == ctx.me.id:
                 message = f"Awwww so nice of you! _kisses **{ctx.author.name}** back!_ 😘 🥰"
@@ -372,8 +383,8 @@ class Roleplay(commands.Cog):
                 message = f"_**{ctx.author.name}** kisses_ {member.mention} 😘 🥰"
             embed.set_image(url=str(choice(KISS)))
             footer = (
-                f"{ctx.author.name} sent: {kiss_to + 1} kisses so far.\n"
-                f"{member.name} received: {kiss_from + 1} kisses so far!"
+                f"{ctx.author.name} sent: {kiss_to} kisses so far.\n"
+                f"{member.name} received: {kiss_from} kisses so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -389,14 +400,7 @@ class Roleplay(commands.Cog):
                 f"{ctx.author.mention} You wanna lick a bot? Very horny! Here, lick this: 🍆"
             )
         async with ctx.typing():
-            lick_to = await self.config.member(ctx.author).LICKS_SENT()
-            lick_from = await self.config.member(member).LICKS_RECEIVED()
-            glick_to = await self.config.user(ctx.author).LICKS_SENT()
-            glick_from = await self.config.user(member).LICKS_RECEIVED()
-            await self.config.member(ctx.author).LICKS_SENT.set(lick_to + 1)
-            await self.config.member(member).LICKS_RECEIVED.set(lick_from + 1)
-            await self.config.user(ctx.author).LICKS_SENT.set(glick_to + 1)
-            await self.config.user(member).LICKS_RECEIVED.set(glick_from + 1)
+            lick_to, lick_from = await self._record("LICKS", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             message = (
                 f"{ctx.author.mention} Poggers, you just licked yourself. 👏"
@@ -405,8 +409,8 @@ class Roleplay(commands.Cog):
             )
             embed.set_image(url=choice(LICK))
             footer = (
-                f"{ctx.author.name} have licked others: {lick_to + 1} times so far.\n"
-                f"{member.name} got licked: {lick_from + 1} times so far!"
+                f"{ctx.author.name} have licked others: {lick_to} times so far.\n"
+                f"{member.name} got licked: {lick_from} times so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -425,19 +429,12 @@ class Roleplay(commands.Cog):
             else f"_**{ctx.author.name}** casually noms_ {member.mention} 😈"
         )
         async with ctx.typing():
-            nom_to = await self.config.member(ctx.author).NOMS_SENT()
-            nom_from = await self.config.member(member).NOMS_RECEIVED()
-            gnom_to = await self.config.user(ctx.author).NOMS_SENT()
-            gnom_from = await self.config.user(member).NOMS_RECEIVED()
-            await self.config.member(ctx.author).NOMS_SENT.set(nom_to + 1)
-            await self.config.member(member).NOMS_RECEIVED.set(nom_from + 1)
-            await self.config.user(ctx.author).NOMS_SENT.set(gnom_to + 1)
-            await self.config.user(member).NOMS_RECEIVED.set(gnom_from + 1)
+            nom_to, nom_from = await self._record("NOMS", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             embed.set_image(url=choice(BITE))
             footer = (
-                f"{ctx.author.name} nom'd: {nom_to + 1} times so far.\n"
-                f"{member.name} received: {nom_from + 1} noms so far!"
+                f"{ctx.author.name} nom'd: {nom_to} times so far.\n"
+                f"{member.name} received: {nom_from} noms so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -451,14 +448,7 @@ class Roleplay(commands.Cog):
         if member.id == ctx.author.id:
             return await ctx.send(f"{ctx.author.mention} _pats themselves, I guess? **yay**_ 🎉")
         async with ctx.typing():
-            pat_to = await self.config.member(ctx.author).PATS_SENT()
-            pat_from = await self.config.member(member).PATS_RECEIVED()
-            gpat_to = await self.config.user(ctx.author).PATS_SENT()
-            gpat_from = await self.config.user(member).PATS_RECEIVED()
-            await self.config.member(ctx.author).PATS_SENT.set(pat_to + 1)
-            await self.config.member(member).PATS_RECEIVED.set(pat_from + 1)
-            await self.config.user(ctx.author).PATS_SENT.set(gpat_to + 1)
-            await self.config.user(member).PATS_RECEIVED.set(gpat_from + 1)
+            pat_to, pat_from = await self._record("PATS", ctx.author, member)
             message = (
                 f"Wowie! Thanks {bold(ctx.author.name)} for giving me pats. 😳 😘"
                 if member.id == ctx.me.id
@@ -467,9 +457,9 @@ class Roleplay(commands.Cog):
             embed = discord.Embed(colour=member.colour)
             embed.set_image(url=choice(PAT))
             footer = (
-                f"{ctx.author.name} gave: {pat_to + 1} pats so far.\n"
+                f"{ctx.author.name} gave: {pat_to} pats so far.\n"
                 f"{'I' if member.id == ctx.me.id else member.name} "
-                f"received: {pat_from + 1} pats so far!"
+                f"received: {pat_from} pats so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -483,14 +473,7 @@ class Roleplay(commands.Cog):
         if member.id == ctx.author.id:
             return await ctx.send(f"{bold(ctx.author.name)} wants to play self poke huh?!")
         async with ctx.typing():
-            poke_to = await self.config.member(ctx.author).POKES_SENT()
-            poke_from = await self.config.member(member).POKES_RECEIVED()
-            gpoke_to = await self.config.user(ctx.author).POKES_SENT()
-            gpoke_from = await self.config.user(member).POKES_RECEIVED()
-            await self.config.member(ctx.author).POKES_SENT.set(poke_to + 1)
-            await self.config.member(member).POKES_RECEIVED.set(poke_from + 1)
-            await self.config.user(ctx.author).POKES_SENT.set(gpoke_to + 1)
-            await self.config.user(member).POKES_RECEIVED.set(gpoke_from + 1)
+            poke_to, poke_from = await self._record("POKES", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             embed = discord.Embed(colour=member.colour)
             if member.id == ctx.me.id:
@@ -499,9 +482,9 @@ class Roleplay(commands.Cog):
                 message = f"_**{ctx.author.name}** casually pokes_ {member.mention}"
             embed.set_image(url=choice(POKE))
             footer = (
-                f"{ctx.author.name} gave: {poke_to + 1} pokes so far.\n"
+                f"{ctx.author.name} gave: {poke_to} pokes so far.\n"
                 f"{'I' if member.id == ctx.me.id else member.name} "
-                f"received: {poke_from + 1} pokes so far!"
+                f"received: {poke_from} pokes so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -527,20 +510,13 @@ class Roleplay(commands.Cog):
                 " not sound so fun. Stop it, get some help."
             )
         async with ctx.typing():
-            punch_to = await self.config.member(ctx.author).PUNCHES_SENT()
-            punch_from = await self.config.member(member).PUNCHES_RECEIVED()
-            gpunch_to = await self.config.user(ctx.author).PUNCHES_SENT()
-            gpunch_from = await self.config.user(member).PUNCHES_RECEIVED()
-            await self.config.member(ctx.author).PUNCHES_SENT.set(punch_to + 1)
-            await self.config.member(member).PUNCHES_RECEIVED.set(punch_from + 1)
-            await self.config.user(ctx.author).PUNCHES_SENT.set(gpunch_to + 1)
-            await self.config.user(member).PUNCHES_RECEIVED.set(gpunch_from + 1)
+            punch_to, punch_from = await self._record("PUNCHES", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             message = f"_**{ctx.author.name}** {choice(PUNCH_STRINGS)}_ {member.mention}"
             embed.set_image(url=choice(PUNCH))
             footer = (
-                f"{ctx.author.name} sent: {punch_to + 1} punches so far.\n"
-                f"{member.name} received: {punch_from + 1} punches so far!"
+                f"{ctx.author.name} sent: {punch_to} punches so far.\n"
+                f"{member.name} received: {punch_from} punches so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -556,20 +532,13 @@ class Roleplay(commands.Cog):
         if member.id == ctx.author.id:
             return await ctx.send(f"{ctx.author.mention} Don't slap yourself, you're precious!")
         async with ctx.typing():
-            slap_to = await self.config.member(ctx.author).SLAPS_SENT()
-            slap_from = await self.config.member(member).SLAPS_RECEIVED()
-            gslap_to = await self.config.user(ctx.author).SLAPS_SENT()
-            gslap_from = await self.config.user(member).SLAPS_RECEIVED()
-            await self.config.member(ctx.author).SLAPS_SENT.set(slap_to + 1)
-            await self.config.member(member).SLAPS_RECEIVED.set(slap_from + 1)
-            await self.config.user(ctx.author).SLAPS_SENT.set(gslap_to + 1)
-            await self.config.user(member).SLAPS_RECEIVED.set(gslap_from + 1)
+            slap_to, slap_from = await self._record("SLAPS", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             message = f"_**{ctx.author.name}** slaps_ {member.mention}"
             embed.set_image(url=choice(SLAP))
             footer = (
-                f"{ctx.author.name} gave: {slap_to + 1} slaps so far.\n"
-                f"{member.name} received: {slap_from + 1} slaps so far!"
+                f"{ctx.author.name} gave: {slap_to} slaps so far.\n"
+                f"{member.name} received: {slap_from} slaps so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -582,13 +551,10 @@ class Roleplay(commands.Cog):
         """Show everyone your smug face!"""
         message = f"_**{ctx.author.name}** smugs at **@\u200bsomeone**_ 😏"
         async with ctx.typing():
-            smug_count = await self.config.member(ctx.author).SMUG_COUNT()
-            gsmug_count = await self.config.user(ctx.author).SMUG_COUNT()
-            await self.config.member(ctx.author).SMUG_COUNT.set(smug_count + 1)
-            await self.config.user(ctx.author).SMUG_COUNT.set(gsmug_count + 1)
+            smug_count = await self._bump(ctx.author, "SMUG_COUNT")
             embed = discord.Embed(colour=ctx.author.colour)
             embed.set_image(url=choice(SMUG))
-            footer = f"{ctx.author.name} has smugged {smug_count + 1} times in this server so far."
+            footer = f"{ctx.author.name} has smugged {smug_count} times in this server so far."
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
 
@@ -604,14 +570,7 @@ class Roleplay(commands.Cog):
                 " Tickling others is more fun though, right? 😏"
             )
         async with ctx.typing():
-            tickle_to = await self.config.member(ctx.author).TICKLES_SENT()
-            tickle_from = await self.config.member(member).TICKLES_RECEIVED()
-            gtickle_to = await self.config.user(ctx.author).TICKLES_SENT()
-            gtickle_from = await self.config.user(member).TICKLES_RECEIVED()
-            await self.config.member(ctx.author).TICKLES_SENT.set(tickle_to + 1)
-            await self.config.member(member).TICKLES_RECEIVED.set(tickle_from + 1)
-            await self.config.user(ctx.author).TICKLES_SENT.set(gtickle_to + 1)
-            await self.config.user(member).TICKLES_RECEIVED.set(gtickle_from + 1)
+            tickle_to, tickle_from = await self._record("TICKLES", ctx.author, member)
             embed = discord.Embed(colour=member.colour)
             if member.id == ctx.me.id:
                 message = f"_Wow, nice tickling skills, {bold(ctx.author.name)}. I LOL'd._ 🤣 🤡"
@@ -620,9 +579,9 @@ class Roleplay(commands.Cog):
                 message = f"_**{ctx.author.name}** tickles_ {member.mention}"
                 embed.set_image(url=choice(TICKLE))
             footer = (
-                f"{ctx.author.name} tickled others: {tickle_to + 1} times so far.\n"
+                f"{ctx.author.name} tickled others: {tickle_to} times so far.\n"
                 f"{'I' if member.id == ctx.me.id else member.name} "
-                f"received: {tickle_from + 1} tickles so far!"
+                f"received: {tickle_from} tickles so far!"
             )
             embed.set_footer(text=footer)
             return await ctx.send(content=quote(message), embed=embed)
@@ -635,6 +594,7 @@ class Roleplay(commands.Cog):
         """Get your roleplay stats for this server."""
         user = member or ctx.author
         async with ctx.typing():
+            await self.flush_counters()
             actions_data = await self.config.member(user).all()
             global_actions_data = await self.config.user(user).all()
             colalign, header = (("left", "right", "right"), ["Action", "Received", "Sent"])
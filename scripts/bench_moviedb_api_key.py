@@ -0,0 +1,56 @@
+"""Per-call cost of reading the TMDB API key the old and the new way.
+
+Before, every moviedb convert, transform and autocomplete awaited
+``bot.get_shared_api_tokens("tmdb")``, which reads Red's Config. Now they
+read ``MovieDB.api_key``, which is loaded once and kept current by the
+``on_red_api_tokens_update`` listener.
+
+Runs against a throwaway JSON Config in a temp folder, the way Red stores
+shared API tokens, so it needs Red-DiscordBot installed but no bot::
+
+    python scripts/bench_moviedb_api_key.py
+"""
+import asyncio
+import tempfile
+import time
+from types import SimpleNamespace
+
+from redbot.core import _drivers, data_manager
+from redbot.core.config import Config
+
+CALLS = 20_000
+
+
+async def main() -> None:
+    data_manager.basic_config = {
+        "DATA_PATH": tempfile.mkdtemp(),
+        "STORAGE_TYPE": "JSON",
+        "STORAGE_DETAILS": {},
+        "CORE_PATH_APPEND": "core",
+        "COG_PATH_APPEND": "cogs",
+    }
+    data_manager._instance_name = "bench"
+    await _drivers.get_driver_class().initialize()
+    # same identifier and custom group Red registers for shared API tokens
+    config = Config.get_core_conf(force_registration=False)
+    config.init_custom("SHARED_API_TOKENS", 2)
+    await config.custom("SHARED_API_TOKENS", "tmdb").set({"api_key": "x" * 32})
+
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        (await config.custom("SHARED_API_TOKENS", "tmdb").all()).get("api_key", "")
+    before = (time.perf_counter() - started) / CALLS
+
+    cog = SimpleNamespace(api_key="x" * 32)
+    bot = SimpleNamespace(get_cog=lambda name: cog)
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        bot.get_cog("MovieDB").api_key
+    after = (time.perf_counter() - started) / CALLS
+
+    print(f"get_shared_api_tokens: {before * 1e6:8.2f} µs per call")
+    print(f"cog.api_key:           {after * 1e6:8.2f} µs per call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""Time building a prolific person's credits, eager (before) vs lazy (after).
+
+``[p]celebrity`` reads the newest 20 cast and 20 crew credits. Before, every
+credit was sorted and turned into a dataclass up front. Now PersonCredits
+keeps the raw lists and a ``[:20]`` slice is served by a top-K selection.
+
+Pass a recorded ``/person/{id}?append_to_response=combined_credits`` response
+to use real data. Without one, a fixed-seed payload of 5,000 cast and 3,000
+crew credits shaped like TMDB's is generated::
+
+    python scripts/bench_person_credits.py [person.json]
+"""
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from moviedb.api.person import CastCredits, CrewCredits, PersonCredits  # noqa: E402
+
+SHOWN = 20
+RUNS = 20
+
+
+def synthetic_credits(cast: int = 5000, crew: int = 3000) -> Dict[str, Any]:
+    rng = random.Random(7)
+
+    def credit(i: int) -> Dict[str, Any]:
+        date = f"{rng.randint(1950, 2026)}-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}"
+        if rng.random() < 0.4:
+            return {
+                "id": i, "media_type": "tv", "name": f"Show {i}", "original_name": f"Show {i}",
+                "first_air_date": date, "episode_count": rng.randint(1, 200),
+                "origin_country": ["US"], "overview": "x" * rng.randint(100, 600),
+                "popularity": rng.random() * 100, "vote_average": rng.random() * 10,
+                "vote_count": rng.randint(0, 20000), "genre_ids": [18, 35], "credit_id": f"c{i}",
+            }
+        return {
+            "id": i, "media_type": "movie", "title": f"Movie {i}", "original_title": f"Movie {i}",
+            "release_date": date if rng.random() < 0.95 else "", "overview": "x" * rng.randint(100, 600),
+            "popularity": rng.random() * 100, "vote_average": rng.random() * 10,
+            "vote_count": rng.randint(0, 20000), "genre_ids": [28, 12], "credit_id": f"c{i}",
+        }
+
+    return {
+        "cast": [dict(credit(i), character=f"Role {i}") for i in range(cast)],
+        "crew": [dict(credit(i), department="Directing", job="Director") for i in range(crew)],
+    }
+
+
+def eager(data: Dict[str, Any]) -> List[Any]:
+    """What PersonCredits.from_data did before: sort everything, build everything."""
+    key = lambda x: x.get("release_date", "") or x.get("first_air_date", "")  # noqa: E731
+    cast = [CastCredits.from_data(x) for x in sorted(data["cast"], key=key, reverse=True)]
+    crew = [CrewCredits.from_data(x) for x in sorted(data["crew"], key=key, reverse=True)]
+    return cast[:SHOWN] + crew[:SHOWN]
+
+
+def lazy(data: Dict[str, Any]) -> List[Any]:
+    credits = PersonCredits.from_data(data)
+    return list(credits.cast[:SHOWN]) + list(credits.crew[:SHOWN])
+
+
+def count_built(func: Callable[[Dict[str, Any]], List[Any]], data: Dict[str, Any]) -> int:
+    """How many credit dataclasses one call constructs."""
+    built = 0
+    originals = {cls: cls.__init__ for cls in (CastCredits, CrewCredits)}
+
+    def counting(init):
+        def wrapper(self, *args, **kwargs):
+            nonlocal built
+            built += 1
+            init(self, *args, **kwargs)
+        return wrapper
+
+    for cls, init in originals.items():
+        cls.__init__ = counting(init)
+    try:
+        func(data)
+    finally:
+        for cls, init in originals.items():
+            cls.__init__ = init
+    return built
+
+
+def measure(func: Callable[[Dict[str, Any]], List[Any]], data: Dict[str, Any]) -> str:
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        func(data)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    result = func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result) == 2 * SHOWN
+    return (
+        f"{statistics.median(timings) * 1000:7.2f} ms median, "
+        f"{peak / 1024:8.1f} KiB peak traced, {count_built(func, data):5d} credits built"
+    )
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        payload = json.loads(Path(sys.argv[1]).read_text(encoding="utf-8"))
+        data = payload.get("combined_credits", payload)
+    else:
+        data = synthetic_credits()
+    print(f"{len(data['cast'])} cast, {len(data['crew'])} crew, newest {SHOWN} of each read")
+    assert [x.id for x in eager(data)] == [x.id for x in lazy(data)], "orders differ"
+    print("before:", measure(eager, data))
+    print("after: ", measure(lazy, data))
+
+
+if __name__ == "__main__":
+    main()
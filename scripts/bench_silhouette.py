@@ -0,0 +1,116 @@
+"""Time one whosthatpokemon silhouette, the old way (before) and the new way (after).
+
+Before, ``generate_image`` decoded template.webp on every call and blacked out
+the resized sprite one pixel at a time in Python. Now the template is decoded
+once and the silhouette is pasted through a mask made from the alpha band.
+Both outputs are compared pixel by pixel. They can differ where resampling
+leaves a fully transparent pixel with some colour in it: the old loop blacked
+those out, the alpha mask leaves them transparent.
+
+Pass a sprite PNG to use a real one. Without one, a fixed 475x475 RGBA sprite
+(the size of the pokemon.com artwork) is drawn::
+
+    python scripts/bench_silhouette.py [sprite.png]
+"""
+import statistics
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageDraw
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from pokebase.pokebase import Pokebase  # noqa: E402
+
+TEMPLATE = ROOT / "pokebase" / "data" / "template.webp"
+RUNS = 5
+
+
+def synthetic_sprite() -> bytes:
+    image = Image.new("RGBA", (475, 475), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((60, 40, 420, 440), fill=(240, 200, 40, 255))
+    draw.polygon([(90, 60), (150, 0), (180, 90)], fill=(30, 30, 30, 255))
+    draw.ellipse((150, 150, 200, 200), fill=(200, 30, 30, 128))
+    out = BytesIO()
+    image.save(out, "png")
+    return out.getvalue()
+
+
+def old_silhouette(sprite: bytes) -> BytesIO:
+    """generate_image's compose step as it was, minus the download."""
+    base_image = Image.open(TEMPLATE).convert("RGBA")
+    bg_width, bg_height = base_image.size
+    poke_image = Image.open(BytesIO(sprite))
+    poke_width, poke_height = poke_image.size
+    poke_image_resized = poke_image.resize((int(poke_width * 1.6), int(poke_height * 1.6)))
+    p_load = poke_image_resized.load()
+    for y in range(poke_image_resized.size[1]):
+        for x in range(poke_image_resized.size[0]):
+            if p_load[x, y] == (0, 0, 0, 0):
+                continue
+            else:
+                p_load[x, y] = (1, 1, 1)
+    paste_w = int((bg_width - poke_width) / 10)
+    paste_h = int((bg_height - poke_height) / 4)
+    base_image.paste(poke_image_resized, (paste_w, paste_h), poke_image_resized)
+    temp = BytesIO()
+    base_image.save(temp, "png")
+    temp.seek(0)
+    return temp
+
+
+def old_step(resized: Image.Image) -> None:
+    p_load = resized.copy().load()
+    for y in range(resized.size[1]):
+        for x in range(resized.size[0]):
+            if p_load[x, y] != (0, 0, 0, 0):
+                p_load[x, y] = (1, 1, 1)
+
+
+def new_step(resized: Image.Image) -> None:
+    mask = resized.getchannel("A").point(lambda a: 255 if a else 0)
+    Image.new("RGB", mask.size, (1, 1, 1))
+
+
+def median_ms(func, *args) -> float:
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    sprite = Path(sys.argv[1]).read_bytes() if len(sys.argv) > 1 else synthetic_sprite()
+    cog = object.__new__(Pokebase)
+    with Image.open(TEMPLATE) as template:
+        cog._template = template.convert("RGB")
+
+    old = Image.open(old_silhouette(sprite)).convert("RGB")
+    new = Image.open(cog._compose_image(sprite, True)).convert("RGB")
+    changed = ImageChops.difference(old, new).convert("L").point(lambda p: 255 if p else 0)
+    print(f"pixels that differ: {changed.histogram()[255]} of {old.width * old.height}")
+
+    with Image.open(BytesIO(sprite)) as poke_image:
+        resized = poke_image.convert("RGBA").resize(
+            (int(poke_image.width * 1.6), int(poke_image.height * 1.6))
+        )
+    print(f"silhouette step:  {median_ms(old_step, resized):7.1f} ms before, "
+          f"{median_ms(new_step, resized):.1f} ms after")
+
+    def decode_template():
+        with Image.open(TEMPLATE) as template:
+            template.convert("RGBA")
+
+    print(f"template decode:  {median_ms(decode_template):7.1f} ms per call before, once per cog load after")
+    print(f"whole silhouette: {median_ms(old_silhouette, sprite):7.1f} ms before (on the event loop)")
+    print(f"whole silhouette: {median_ms(cog._compose_image, sprite, True):7.1f} ms after (in an executor)")
+
+
+if __name__ == "__main__":
+    main()
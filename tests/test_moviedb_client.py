@@ -0,0 +1,75 @@
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from moviedb.api import base, client
+from moviedb.api.client import RateLimiter
+
+
+async def start_stub(hits: list, delay: float = 0.2) -> web.AppRunner:
+    async def search(request: web.Request) -> web.Response:
+        hits.append(request.query["query"])
+        await asyncio.sleep(delay)
+        return web.json_response({"results": [{"id": 1, "media_type": "movie"}]})
+
+    app = web.Application()
+    app.router.add_get("/search/multi", search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def run_against_stub(monkeypatch, scenario) -> list:
+    hits: list = []
+
+    async def main():
+        runner = await start_stub(hits)
+        port = runner.addresses[0][1]
+        monkeypatch.setattr(base, "API_BASE", f"http://127.0.0.1:{port}")
+        monkeypatch.setattr(client, "LIMITER", RateLimiter())
+        base.SEARCH_CACHE.clear()
+        try:
+            async with aiohttp.ClientSession() as session:
+                await scenario(session)
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+    return hits
+
+
+def test_concurrent_identical_requests_hit_upstream_once(monkeypatch):
+    async def scenario(session):
+        results = await asyncio.gather(
+            *(base.multi_search(session, "key", "dune") for _ in range(10))
+        )
+        assert all(result == results[0] for result in results)
+
+    assert run_against_stub(monkeypatch, scenario) == ["dune"]
+
+
+def test_queries_are_normalised_before_coalescing(monkeypatch):
+    async def scenario(session):
+        await asyncio.gather(
+            base.multi_search(session, "key", "Dune"),
+            base.multi_search(session, "key", "dune "),
+            base.multi_search(session, "key", "  DUNE"),
+        )
+
+    assert run_against_stub(monkeypatch, scenario) == ["dune"]
+
+
+def test_cancelling_one_caller_leaves_the_others_running(monkeypatch):
+    async def scenario(session):
+        callers = [
+            asyncio.create_task(base.multi_search(session, "key", "dune")) for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+        callers[0].cancel()
+        done = await asyncio.gather(*callers, return_exceptions=True)
+        assert isinstance(done[0], asyncio.CancelledError)
+        assert done[1] == done[2] == [{"id": 1, "media_type": "movie"}]
+
+    assert run_against_stub(monkeypatch, scenario) == ["dune"]